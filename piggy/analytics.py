@@ -5,15 +5,17 @@ This module contains pure business logic functions for analyzing installment pla
 categorizing payments, and calculating statistics.
 """
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
+from operator import attrgetter, itemgetter
 from typing import TypedDict
 
-from piggy.installment_plan import Installment, InstallmentPlan
+from piggy.installment_plan import Installment, InstallmentPlan, PaymentStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentInfo:
     """Information about a payment installment for display purposes."""
 
@@ -21,6 +23,7 @@ class PaymentInfo:
     merchant: str
     installment: Installment
     days_until_due: int
+    overdue_days: int = 0
 
 
 class CategorizedPayments(TypedDict):
@@ -60,11 +63,11 @@ def group_payments_by_date(payments: list[PaymentInfo]) -> dict[date, list[Payme
             grouped[due_date] = []
         grouped[due_date].append(payment)
 
-    return dict(sorted(grouped.items()))
+    return dict(sorted(grouped.items(), key=itemgetter(0)))
 
 
 def categorize_unpaid_installments(
-    plans_dict: dict[str, InstallmentPlan], today: date, upcoming_days: int
+    plans_dict: dict[str, InstallmentPlan], today: date, upcoming_days: int, update_overdue: bool = False
 ) -> CategorizedPayments:
     """
     Categorize unpaid installments by due date.
@@ -72,28 +75,49 @@ def categorize_unpaid_installments(
     :param plans_dict: Dictionary of plan_id -> InstallmentPlan
     :param today: Current date
     :param upcoming_days: Number of days to consider as upcoming
+    :param update_overdue: If True, also mark pending installments past their due date as OVERDUE,
+                           matching InstallmentPlan.update_overdue_status() in the same pass
     :return: CategorizedPayments with installments sorted by category
     """
+    today_ordinal = today.toordinal()
+    paid, pending = PaymentStatus.PAID, PaymentStatus.PENDING
     all_unpaid = []
     for plan_id, plan in plans_dict.items():
-        # Cache unpaid_installments to avoid repeated property access
-        unpaid = plan.unpaid_installments
-        for inst in unpaid:
+        overdue_updated = False
+        for inst in plan.installments:
+            if inst.status == paid:
+                continue
+
+            days_until_due = inst.due_date.toordinal() - today_ordinal
+            if update_overdue and days_until_due < 0 and inst.status == pending:
+                inst.status = PaymentStatus.OVERDUE
+                overdue_updated = True
+
             all_unpaid.append(
                 PaymentInfo(
                     plan_id=plan_id,
                     merchant=plan.merchant_name,
                     installment=inst,
-                    days_until_due=(inst.due_date - today).days,
+                    days_until_due=days_until_due,
+                    overdue_days=max(-days_until_due, 0),
                 )
             )
 
-    all_unpaid.sort(key=lambda x: x.installment.due_date)
+        if overdue_updated:
+            plan.updated_at = datetime.now()
+
+    days_key = attrgetter("days_until_due")
+    all_unpaid.sort(key=days_key)
+
+    # Sorted by days until due, so each category is a contiguous slice
+    overdue_end = bisect_left(all_unpaid, 0, key=days_key)
+    due_today_end = bisect_right(all_unpaid, 0, lo=overdue_end, key=days_key)
+    upcoming_end = bisect_right(all_unpaid, upcoming_days, lo=due_today_end, key=days_key)
 
-    overdue = [p for p in all_unpaid if p.days_until_due < 0]
-    due_today = [p for p in all_unpaid if p.days_until_due == 0]
-    upcoming = [p for p in all_unpaid if 0 < p.days_until_due <= upcoming_days]
-    future = [p for p in all_unpaid if p.days_until_due > upcoming_days]
+    overdue = all_unpaid[:overdue_end]
+    due_today = all_unpaid[overdue_end:due_today_end]
+    upcoming = all_unpaid[due_today_end:upcoming_end]
+    future = all_unpaid[upcoming_end:]
 
     return CategorizedPayments(
         all_unpaid=all_unpaid, overdue=overdue, due_today=due_today, upcoming=upcoming, future=future
@@ -116,11 +140,18 @@ def calculate_payment_statistics(
     total_remaining = Decimal(0)
     total_paid = Decimal(0)
     fully_paid_count = 0
+    paid = PaymentStatus.PAID
 
     for plan in plans_dict.values():
-        total_remaining += plan.remaining_balance
-        total_paid += sum((inst.amount for inst in plan.installments if inst.is_paid), start=Decimal(0))
-        if plan.is_fully_paid:
+        plan_fully_paid = True
+        for inst in plan.installments:
+            if inst.status == paid:
+                total_paid += inst.amount
+            else:
+                total_remaining += inst.remaining_amount
+                plan_fully_paid = False
+
+        if plan_fully_paid:
             fully_paid_count += 1
 
     overdue_total = sum((p.installment.amount for p in categorized["overdue"]), start=Decimal(0))
@@ -169,15 +200,16 @@ def filter_plans_by_status(
     :param has_overdue: If True, only plans with overdue payments; if False, only plans without overdue; if None, no filter
     :return: Filtered dictionary of plans
     """
-    result = plans_dict
+    if fully_paid is None and has_overdue is None:
+        return plans_dict
 
-    if fully_paid is not None:
-        result = {plan_id: plan for plan_id, plan in result.items() if plan.is_fully_paid == fully_paid}
-
-    if has_overdue is not None:
-        result = {plan_id: plan for plan_id, plan in result.items() if plan.has_overdue_payments == has_overdue}
-
-    return result
+    today = date.today()
+    return {
+        plan_id: plan
+        for plan_id, plan in plans_dict.items()
+        if (fully_paid is None or plan.is_fully_paid == fully_paid)
+        and (has_overdue is None or plan.has_overdue_as_of(today) == has_overdue)
+    }
 
 
 def filter_plans_by_amount(
@@ -197,16 +229,25 @@ def filter_plans_by_amount(
     :param max_remaining: Maximum remaining balance
     :return: Filtered dictionary of plans
     """
+    check_total = min_total is not None or max_total is not None
+    check_remaining = min_remaining is not None or max_remaining is not None
+    if not check_total and not check_remaining:
+        return dict(plans_dict)
+
     result = {}
     for plan_id, plan in plans_dict.items():
-        if min_total is not None and plan.total_amount < min_total:
-            continue
-        if max_total is not None and plan.total_amount > max_total:
-            continue
-        if min_remaining is not None and plan.remaining_balance < min_remaining:
+        total_amount = plan.total_amount
+        if min_total is not None and total_amount < min_total:
             continue
-        if max_remaining is not None and plan.remaining_balance > max_remaining:
+        if max_total is not None and total_amount > max_total:
             continue
+        if check_remaining:
+            # remaining_balance sums the unpaid installments, so compute it once per plan
+            remaining_balance = plan.remaining_balance
+            if min_remaining is not None and remaining_balance < min_remaining:
+                continue
+            if max_remaining is not None and remaining_balance > max_remaining:
+                continue
         result[plan_id] = plan
 
     return result
@@ -229,18 +270,25 @@ def filter_plans_by_date(
     :param next_payment_before: Only plans with next payment before this date
     :return: Filtered dictionary of plans
     """
+    check_next_payment = next_payment_after is not None or next_payment_before is not None
+
     result = {}
     for plan_id, plan in plans_dict.items():
-        if purchase_after is not None and plan.purchase_date < purchase_after:
+        purchase_date = plan.purchase_date
+        if purchase_after is not None and purchase_date < purchase_after:
             continue
-        if purchase_before is not None and plan.purchase_date > purchase_before:
+        if purchase_before is not None and purchase_date > purchase_before:
             continue
 
-        next_payment = plan.next_payment_due
-        if next_payment_after is not None and (next_payment is None or next_payment < next_payment_after):
-            continue
-        if next_payment_before is not None and (next_payment is None or next_payment > next_payment_before):
-            continue
+        if check_next_payment:
+            # next_payment_due scans the installments, so only look it up when a bound needs it
+            next_payment = plan.next_payment_due
+            if next_payment is None:
+                continue
+            if next_payment_after is not None and next_payment < next_payment_after:
+                continue
+            if next_payment_before is not None and next_payment > next_payment_before:
+                continue
 
         result[plan_id] = plan
 
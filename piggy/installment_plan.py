@@ -1,5 +1,5 @@
 import json
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 from enum import StrEnum
 from pathlib import Path
@@ -214,7 +214,10 @@ class InstallmentPlan(BaseModel):
     @property
     def remaining_balance(self) -> Decimal:
         """Calculate the remaining balance from unpaid installments"""
-        return sum((inst.remaining_amount for inst in self.unpaid_installments), start=Decimal(0))
+        return sum(
+            (inst.remaining_amount for inst in self.installments if inst.status != PaymentStatus.PAID),
+            start=Decimal(0),
+        )
 
     @property
     def is_fully_paid(self) -> bool:
@@ -224,10 +227,10 @@ class InstallmentPlan(BaseModel):
     @property
     def next_payment_due(self) -> date | None:
         """Get the next payment due date"""
-        unpaid = [inst for inst in self.installments if inst.status == PaymentStatus.PENDING]
-        if not unpaid:
-            return None
-        return min(inst.due_date for inst in unpaid)
+        return min(
+            (inst.due_date for inst in self.installments if inst.status == PaymentStatus.PENDING),
+            default=None,
+        )
 
     def get_overdue_installments(self, as_of: date | None = None) -> list[Installment]:
         """
@@ -244,7 +247,16 @@ class InstallmentPlan(BaseModel):
     @property
     def has_overdue_payments(self) -> bool:
         """Check if any installments are overdue based on today's date"""
-        return len(self.get_overdue_installments()) > 0
+        return self.has_overdue_as_of(date.today())
+
+    def has_overdue_as_of(self, as_of: date) -> bool:
+        """
+        Check if any unpaid installment was due before the given date.
+
+        :param as_of: Date to check against
+        :return: True if at least one unpaid installment is past due
+        """
+        return any(inst.status != PaymentStatus.PAID and inst.due_date < as_of for inst in self.installments)
 
     def update_overdue_status(self, as_of: date | None = None) -> int:
         """
@@ -278,15 +290,17 @@ class InstallmentPlan(BaseModel):
         if numbers is None:
             return self.installments
 
-        result = []
-        num_installments = len(self.installments)
+        if not numbers:
+            return []
 
-        for num in numbers:
-            if num < 1 or num > num_installments:
-                raise ValueError(f"Installment #{num} does not exist.")
-            result.append(self.installments[num - 1])
+        installments = self.installments
+        lowest, highest = min(numbers), max(numbers)
+        if lowest < 1:
+            raise ValueError(f"Installment #{lowest} does not exist.")
+        if highest > len(installments):
+            raise ValueError(f"Installment #{highest} does not exist.")
 
-        return result
+        return [installments[num - 1] for num in numbers]
 
     def get_installment(self, number: int) -> Installment:
         """
@@ -316,7 +330,7 @@ class InstallmentPlan(BaseModel):
         installment = self.get_installment(number)
         old_amount = installment.amount
         installment.set_amount(new_amount)
-        self.total_amount = self.total_amount - old_amount + new_amount
+        self.total_amount += new_amount - old_amount
         self.updated_at = datetime.now()
 
     def set_installment_due_date(self, number: int, new_due_date: date) -> None:
@@ -368,6 +382,16 @@ class InstallmentPlan(BaseModel):
         installment.mark_unpaid()
         self.updated_at = datetime.now()
 
+    def mark_all_paid(self, paid_date: date) -> None:
+        """
+        Mark every installment as paid in full.
+
+        :param paid_date: Date the payments were made
+        """
+        for installment in self.installments:
+            installment.mark_full_payment(paid_date)
+        self.updated_at = datetime.now()
+
     @staticmethod
     def build(
         merchant_name: str,
@@ -392,18 +416,18 @@ class InstallmentPlan(BaseModel):
         :return: Validated InstallmentPlan instance
         :raises ValueError: If validation fails
         """
-        from datetime import timedelta
-
         installment_amount = total_amount / num_installments
-        installments = []
-        current_date = first_payment_date
-
-        for i in range(1, num_installments + 1):
-            installment = Installment(
-                installment_number=i, amount=installment_amount, due_date=current_date, status=PaymentStatus.PENDING
+        step = timedelta(days=days_between)
+
+        installments = [
+            Installment(
+                installment_number=i,
+                amount=installment_amount,
+                due_date=first_payment_date + step * (i - 1),
+                status=PaymentStatus.PENDING,
             )
-            installments.append(installment)
-            current_date += timedelta(days=days_between)
+            for i in range(1, num_installments + 1)
+        ]
 
         return InstallmentPlan(
             merchant_name=merchant_name,
@@ -412,10 +436,12 @@ class InstallmentPlan(BaseModel):
             installments=installments,
         )
 
-    def to_json(self, file_path: str | None = None) -> str:
+    def to_json(self, file_path: str | Path | None = None) -> str:
         """
         Serialize the installment plan to JSON format.
 
+        Serialization is done by pydantic-core directly, without building an intermediate dict.
+
         :param file_path: Optional file path to save JSON
         :return: JSON string representation
         :raises ValueError: If file_path is an existing directory
@@ -423,8 +449,7 @@ class InstallmentPlan(BaseModel):
         """
         from piggy.utils.helpers import ensure_directory
 
-        json_data = self.model_dump(mode="json")
-        json_str = json.dumps(json_data, indent=2, default=str)
+        json_str = self.model_dump_json(indent=2)
 
         if file_path:
             validated_path = ensure_directory(file_path)
@@ -439,12 +464,13 @@ class InstallmentPlan(BaseModel):
         return cls.model_validate(data)
 
     @classmethod
-    def from_json_file(cls, file_path: str) -> "InstallmentPlan":
+    def from_json_file(cls, file_path: str | Path) -> "InstallmentPlan":
         """Load an installment plan from a JSON file"""
-        json_str = Path(file_path).read_text(encoding="utf-8")
+        with open(file_path, encoding="utf-8") as file:
+            json_str = file.read()
         return cls.from_json(json_str)
 
-    def to_csv(self, file_path: str) -> str:
+    def to_csv(self, file_path: str | Path) -> None:
         """
         Export installment plan data to CSV format (flattened structure).
 
@@ -452,7 +478,6 @@ class InstallmentPlan(BaseModel):
         Includes all timestamps and computed properties for data analysis.
 
         :param file_path: File path to save CSV
-        :return: CSV content as string
         :raises ValueError: If file_path is an existing directory
         :raises OSError: If file write fails or parent directory cannot be created
         """
@@ -481,7 +506,7 @@ class InstallmentPlan(BaseModel):
             "is_partially_paid",
         ]
 
-        rows = [
+        rows = (
             {
                 "merchant_name": self.merchant_name,
                 "total_amount": format_value(self.total_amount),
@@ -501,6 +526,6 @@ class InstallmentPlan(BaseModel):
                 "is_partially_paid": inst.is_partially_paid,
             }
             for inst in self.installments
-        ]
+        )
 
-        return write_csv_from_dicts(headers, rows, file_path)
+        write_csv_from_dicts(headers, rows, file_path)
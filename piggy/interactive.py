@@ -3,6 +3,7 @@ from collections.abc import Callable
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from enum import IntEnum
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
@@ -22,6 +23,12 @@ from piggy.plan_manager import PlanManager
 from piggy.utils import get_project_root
 from piggy.utils.input import get_date_input, get_decimal_input, get_input, get_int_input
 
+SECTION_SEPARATOR = "-" * 50
+WARNING_SEPARATOR = "=" * 50
+HEADING_FORMAT = "\n=== {} ===\n"
+STATUS_SYMBOLS = {PaymentStatus.PAID: "✓", PaymentStatus.PENDING: "○", PaymentStatus.OVERDUE: "○"}
+PARTIAL_SYMBOL = "◐"
+
 
 class PaymentFrequency(IntEnum):
     """Common payment frequencies in days."""
@@ -31,11 +38,20 @@ class PaymentFrequency(IntEnum):
     WEEKLY = 7
 
 
-class ContextKeys:
-    """Constants for NavigationContext data keys."""
+class AppContext(NavigationContext):
+    """Navigation context holding the plan manager and the plan currently being edited."""
+
+    __slots__ = ("plan_manager", "edit_plan_id")
 
-    PLAN_MANAGER = "plan_manager"
-    EDIT_PLAN_ID = "edit_plan_id"
+    def __init__(self, plan_manager: PlanManager):
+        """
+        Initialize the application context.
+
+        :param plan_manager: PlanManager shared by all command handlers
+        """
+        super().__init__()
+        self.plan_manager = plan_manager
+        self.edit_plan_id: str | None = None
 
 
 def generate_plan_id(merchant_name: str, purchase_date: date, plan_manager: PlanManager | None = None) -> str:
@@ -66,7 +82,7 @@ def generate_plan_id(merchant_name: str, purchase_date: date, plan_manager: Plan
 
 
 def print_heading(heading: str) -> None:
-    print(f"\n=== {heading} ===\n")
+    print(HEADING_FORMAT.format(heading))
 
 
 def pluralize(count: int, singular: str, plural: str | None = None) -> str:
@@ -93,9 +109,9 @@ def format_currency(amount: Decimal) -> str:
     return f"${amount:.2f}"
 
 
-def create_installment_plan(context: NavigationContext) -> CommandResult:
+def create_installment_plan(context: AppContext) -> CommandResult:
     print_heading("Create New Installment Plan")
-    plan_manager = context.get_data(ContextKeys.PLAN_MANAGER)
+    plan_manager = context.plan_manager
 
     merchant_name = get_input("Merchant name")
     if not merchant_name:
@@ -151,7 +167,7 @@ def create_installment_plan(context: NavigationContext) -> CommandResult:
         return CommandResult(message=f"Error creating plan: {e}")
 
 
-def list_installment_plans(context: NavigationContext) -> CommandResult:
+def list_installment_plans(context: AppContext) -> CommandResult:
     """
     Display a summary list of all installment plans.
 
@@ -159,24 +175,28 @@ def list_installment_plans(context: NavigationContext) -> CommandResult:
     :return: CommandResult with continuation message
     """
     print_heading("List Installment Plans")
-    plan_manager = context.get_data(ContextKeys.PLAN_MANAGER)
+    plans_dict = context.plan_manager.list_plans()
 
-    if not plan_manager.has_plans():
+    if not plans_dict:
         return CommandResult(message="No installment plans found.")
 
-    for plan_id, plan in plan_manager.list_plans().items():
-        print(f"\nPlan ID: {plan_id}")
-        print(f"  Merchant: {plan.merchant_name}")
-        print(f"  Total: {format_currency(plan.total_amount)}")
-        print(f"  Remaining: {format_currency(plan.remaining_balance)}")
-        print(f"  Installments: {len(plan.unpaid_installments)}/{plan.num_installments} remaining")
-        print(f"  Next due: {plan.next_payment_due or 'N/A'}")
-        print(f"  Status: {'Fully Paid' if plan.is_fully_paid else 'Active'}")
+    lines = []
+    for plan_id, plan in plans_dict.items():
+        unpaid = plan.unpaid_installments
+        remaining = sum((inst.remaining_amount for inst in unpaid), start=Decimal(0))
+        lines.append(f"\nPlan ID: {plan_id}")
+        lines.append(f"  Merchant: {plan.merchant_name}")
+        lines.append(f"  Total: {format_currency(plan.total_amount)}")
+        lines.append(f"  Remaining: {format_currency(remaining)}")
+        lines.append(f"  Installments: {len(unpaid)}/{plan.num_installments} remaining")
+        lines.append(f"  Next due: {plan.next_payment_due or 'N/A'}")
+        lines.append(f"  Status: {'Active' if unpaid else 'Fully Paid'}")
+    print("\n".join(lines))
 
     return CommandResult(wait_for_key=True)
 
 
-def view_plan_details(context: NavigationContext) -> CommandResult:
+def view_plan_details(context: AppContext) -> CommandResult:
     """
     Display detailed information for a selected installment plan.
 
@@ -191,17 +211,20 @@ def view_plan_details(context: NavigationContext) -> CommandResult:
 
     plan_id, plan = result
 
-    print(f"\n=== {plan.merchant_name} ===")
-    print(f"Total Amount: {format_currency(plan.total_amount)}")
-    print(f"Purchase Date: {plan.purchase_date}")
-    print(f"Remaining Balance: {format_currency(plan.remaining_balance)}")
-    print(f"Next Payment Due: {plan.next_payment_due or 'N/A'}")
-    print("\nInstallments:")
+    lines = [
+        f"\n=== {plan.merchant_name} ===",
+        f"Total Amount: {format_currency(plan.total_amount)}",
+        f"Purchase Date: {plan.purchase_date}",
+        f"Remaining Balance: {format_currency(plan.remaining_balance)}",
+        f"Next Payment Due: {plan.next_payment_due or 'N/A'}",
+        "\nInstallments:",
+    ]
 
     for inst in plan.installments:
-        print(format_installment_line(inst, show_status=True))
+        lines.append(_fmt_line_with_status(inst))
         if inst.paid_date:
-            print(f"     Paid on: {inst.paid_date}")
+            lines.append(f"     Paid on: {inst.paid_date}")
+    print("\n".join(lines))
 
     return CommandResult(wait_for_key=True)
 
@@ -213,12 +236,9 @@ def get_installment_status_symbol(inst: Installment) -> str:
     :param inst: Installment to get symbol for
     :return: Status symbol (✓ for paid, ◐ for partially paid, ○ for unpaid)
     """
-    if inst.status == PaymentStatus.PAID:
-        return "✓"
-    elif inst.is_partially_paid:
-        return "◐"
-    else:
-        return "○"
+    if inst.status != PaymentStatus.PAID and inst.is_partially_paid:
+        return PARTIAL_SYMBOL
+    return STATUS_SYMBOLS[inst.status]
 
 
 def get_plan_status_icon(plan: InstallmentPlan) -> str:
@@ -231,31 +251,53 @@ def get_plan_status_icon(plan: InstallmentPlan) -> str:
     return "✓" if plan.is_fully_paid else "○"
 
 
-def format_installment_line(
-    inst: Installment, show_status: bool = False, show_paid_date_inline: bool = False, indent: str = "  "
-) -> str:
+def _format_partial_payment(inst: Installment) -> str:
+    """
+    Format the partial payment suffix for an installment line.
+
+    :param inst: Installment to format
+    :return: Paid/remaining suffix, or an empty string if not partially paid
+    """
+    if not inst.is_partially_paid:
+        return ""
+    return f" [Paid: {format_currency(inst.amount_paid)}, Remaining: {format_currency(inst.remaining_amount)}]"
+
+
+def _format_paid_date(inst: Installment) -> str:
+    """
+    Format the inline paid date suffix for an installment line.
+
+    :param inst: Installment to format
+    :return: Paid date suffix, or an empty string if not paid
+    """
+    if inst.status != PaymentStatus.PAID or not inst.paid_date:
+        return ""
+    return f" [PAID on {inst.paid_date}]"
+
+
+def _fmt_line_plain(inst: Installment, indent: str = "  ") -> str:
     """
     Format an installment as a display line.
 
     :param inst: Installment to format
-    :param show_status: Include status value in brackets
-    :param show_paid_date_inline: Include paid date inline (vs separate line)
     :param indent: Indentation string
     :return: Formatted installment line
     """
-    status_symbol = get_installment_status_symbol(inst)
-    line = f"{indent}{status_symbol} #{inst.installment_number}: {format_currency(inst.amount)} due {inst.due_date}"
-
-    if inst.is_partially_paid:
-        line += f" [Paid: {format_currency(inst.amount_paid)}, Remaining: {format_currency(inst.remaining_amount)}]"
+    return (
+        f"{indent}{get_installment_status_symbol(inst)} #{inst.installment_number}: "
+        f"{format_currency(inst.amount)} due {inst.due_date}{_format_partial_payment(inst)}"
+    )
 
-    if show_status:
-        line += f" [{inst.status.value}]"
 
-    if show_paid_date_inline and inst.status == PaymentStatus.PAID and inst.paid_date:
-        line += f" [PAID on {inst.paid_date}]"
+def _fmt_line_with_status(inst: Installment, indent: str = "  ") -> str:
+    """
+    Format an installment as a display line with its status value in brackets.
 
-    return line
+    :param inst: Installment to format
+    :param indent: Indentation string
+    :return: Formatted installment line
+    """
+    return f"{_fmt_line_plain(inst, indent)} [{inst.status.value}]"
 
 
 def _display_installments(plan: InstallmentPlan) -> None:
@@ -265,17 +307,11 @@ def _display_installments(plan: InstallmentPlan) -> None:
     :param plan: InstallmentPlan to display
     """
     print("\nAll installments:")
+    paid = PaymentStatus.PAID
     for inst in plan.installments:
         status_symbol = get_installment_status_symbol(inst)
 
-        if inst.status == PaymentStatus.PAID:
-            status_text = f" [PAID on {inst.paid_date}]"
-        elif inst.is_partially_paid:
-            status_text = (
-                f" [Paid: {format_currency(inst.amount_paid)}, Remaining: {format_currency(inst.remaining_amount)}]"
-            )
-        else:
-            status_text = ""
+        status_text = _format_paid_date(inst) if inst.status == paid else _format_partial_payment(inst)
 
         print(
             f"{status_symbol} {inst.installment_number}. Installment #{inst.installment_number}: "
@@ -292,7 +328,7 @@ def select_installment(plan: InstallmentPlan) -> Installment | None:
     """
     print("\nInstallments:")
     for inst in plan.installments:
-        print(format_installment_line(inst))
+        print(_fmt_line_plain(inst))
 
     inst_num = get_int_input("\nSelect installment number to edit", min_val=1, max_val=plan.num_installments)
     if not inst_num:
@@ -305,11 +341,14 @@ def _parse_installment_numbers(input_str: str) -> list[int]:
     """
     Parse comma-separated installment numbers from user input.
 
+    Surrounding whitespace is accepted by int() itself, and repeated numbers are
+    dropped so an installment is only processed once.
+
     :param input_str: User input string (e.g., "1,2,3" or "1")
-    :return: List of installment numbers
+    :return: List of unique installment numbers in input order
     :raises ValueError: If input contains invalid numbers
     """
-    return [int(num.strip()) for num in input_str.split(",")]
+    return list(dict.fromkeys(map(int, input_str.split(","))))
 
 
 def _format_marking_result(count: int, action: str) -> str:
@@ -325,7 +364,7 @@ def _format_marking_result(count: int, action: str) -> str:
     return f"\n{count} {pluralize(count, 'installment')} marked as {action}!"
 
 
-def mark_payment(context: NavigationContext) -> CommandResult:
+def mark_payment(context: AppContext) -> CommandResult:
     print_heading("Mark Payment")
 
     result = select_plan(context)
@@ -363,11 +402,15 @@ def mark_payment(context: NavigationContext) -> CommandResult:
         if selected_inst.status == PaymentStatus.PAID:
             return CommandResult(message=f"Installment #{selected_inst.installment_number} is already fully paid.")
 
-        print(f"\nInstallment #{selected_inst.installment_number}:")
-        print(f"  Total amount: {format_currency(selected_inst.amount)}")
+        print(
+            f"\nInstallment #{selected_inst.installment_number}:\n"
+            f"  Total amount: {format_currency(selected_inst.amount)}"
+        )
         if selected_inst.amount_paid > 0:
-            print(f"  Already paid: {format_currency(selected_inst.amount_paid)}")
-            print(f"  Remaining: {format_currency(selected_inst.remaining_amount)}")
+            print(
+                f"  Already paid: {format_currency(selected_inst.amount_paid)}\n"
+                f"  Remaining: {format_currency(selected_inst.remaining_amount)}"
+            )
 
         payment_amount = get_decimal_input("Payment amount", default=selected_inst.remaining_amount)
         if not payment_amount:
@@ -384,16 +427,14 @@ def mark_payment(context: NavigationContext) -> CommandResult:
             if payment_amount == selected_inst.remaining_amount:
                 selected_inst.mark_full_payment(payment_date)
                 plan.updated_at = datetime.now()
-                plan_manager: PlanManager = context.get_data(ContextKeys.PLAN_MANAGER)
-                plan_manager.mark_as_modified()
+                context.plan_manager.mark_as_modified()
                 return CommandResult(
                     message=f"\n✓ Installment #{selected_inst.installment_number} marked as paid on {payment_date}!"
                 )
             else:
                 selected_inst.mark_partial_payment(payment_amount, payment_date)
                 plan.updated_at = datetime.now()
-                plan_manager: PlanManager = context.get_data(ContextKeys.PLAN_MANAGER)
-                plan_manager.mark_as_modified()
+                context.plan_manager.mark_as_modified()
                 return CommandResult(
                     message=f"\n◐ Partial payment of {format_currency(payment_amount)} recorded. "
                     f"Remaining: {format_currency(selected_inst.remaining_amount)}"
@@ -411,20 +452,15 @@ def mark_payment(context: NavigationContext) -> CommandResult:
         except ValueError as e:
             return CommandResult(message=str(e))
 
-        for inst in selected_installments:
-            if inst.is_unpaid:
-                print(f"Note: Installment #{inst.installment_number} is already marked as unpaid.")
-
-        marked_count = 0
         for selected_inst in selected_installments:
+            if selected_inst.is_unpaid:
+                print(f"Note: Installment #{selected_inst.installment_number} is already marked as unpaid.")
             selected_inst.mark_unpaid()
-            marked_count += 1
             print(f"○ Installment #{selected_inst.installment_number} marked as unpaid")
 
         plan.updated_at = datetime.now()
-        plan_manager: PlanManager = context.get_data(ContextKeys.PLAN_MANAGER)
-        plan_manager.mark_as_modified()
-        return CommandResult(message=_format_marking_result(marked_count, "unpaid"))
+        context.plan_manager.mark_as_modified()
+        return CommandResult(message=_format_marking_result(len(selected_installments), "unpaid"))
 
 
 def format_payment_date_header(due_date: date) -> str:
@@ -452,9 +488,8 @@ def format_payment_item(payment: PaymentInfo, show_days_info: bool = True) -> st
     amount_display = format_currency(inst.remaining_amount) if inst.is_partially_paid else format_currency(inst.amount)
 
     if show_days_info:
-        if payment.days_until_due < 0:
-            days_overdue = abs(payment.days_until_due)
-            lines.append(f"    {amount_display} ({days_overdue} days overdue)")
+        if payment.overdue_days:
+            lines.append(f"    {amount_display} ({payment.overdue_days} days overdue)")
         elif payment.days_until_due > 0:
             days_str = f"in {payment.days_until_due} {pluralize(payment.days_until_due, 'day')}"
             lines.append(f"    {amount_display} ({days_str})")
@@ -481,124 +516,144 @@ def format_daily_subtotal(total: Decimal, indent: str = "    ") -> str:
     return f"{indent}{separator}\n{indent}Daily Total: {format_currency(total)}"
 
 
-def display_grouped_payments(
+def _grouped_payment_lines(payments_by_date: dict[date, list[PaymentInfo]], show_days_info: bool) -> list[str]:
+    """
+    Build the output lines for payments grouped by date with subtotals.
+
+    :param payments_by_date: Dictionary mapping date -> list of payments
+    :param show_days_info: Whether to show days overdue/until due information
+    :return: List of output lines
+    """
+    lines = []
+    multiple_dates = len(payments_by_date) > 1
+
+    for due_date, payments in payments_by_date.items():
+        if multiple_dates or len(payments) > 1:
+            lines.append(format_payment_date_header(due_date))
+
+        lines.extend(format_payment_item(payment, show_days_info) for payment in payments)
+
+        if len(payments) > 1:
+            daily_total = sum((p.installment.amount for p in payments), start=Decimal(0))
+            lines.append(format_daily_subtotal(daily_total))
+
+        if multiple_dates:
+            lines.append("")
+
+    if len(payments_by_date) == 1:
+        lines.append("")
+
+    return lines
+
+
+def _payment_section_lines(
     payments_by_date: dict[date, list[PaymentInfo]],
     section_emoji: str,
     section_title: str,
     show_days_info: bool = True,
-) -> None:
+) -> list[str]:
     """
-    Display a section of payments grouped by date with subtotals.
+    Build the output lines for a section of payments grouped by date.
 
     :param payments_by_date: Dictionary mapping date -> list of payments
     :param section_emoji: Emoji to display in section header
     :param section_title: Title text for the section
     :param show_days_info: Whether to show days overdue/until due information
+    :return: List of output lines
     """
     total_payments = sum(len(payments) for payments in payments_by_date.values())
-    print(f"{section_emoji} {section_title} ({total_payments})")
-    print("-" * 50)
-
-    for due_date, payments in payments_by_date.items():
-        if len(payments_by_date) > 1 or len(payments) > 1:
-            print(format_payment_date_header(due_date))
+    lines = [f"{section_emoji} {section_title} ({total_payments})", SECTION_SEPARATOR]
+    lines.extend(_grouped_payment_lines(payments_by_date, show_days_info))
+    return lines
 
-        for payment in payments:
-            print(format_payment_item(payment, show_days_info))
 
-        if len(payments) > 1:
-            daily_total = sum((p.installment.amount for p in payments), start=Decimal(0))
-            print(format_daily_subtotal(daily_total))
-
-        if len(payments_by_date) > 1:
-            print()
+def display_grouped_payments(
+    payments_by_date: dict[date, list[PaymentInfo]],
+    section_emoji: str,
+    section_title: str,
+    show_days_info: bool = True,
+) -> None:
+    """
+    Display a section of payments grouped by date with subtotals.
 
-    if len(payments_by_date) == 1:
-        print()
+    :param payments_by_date: Dictionary mapping date -> list of payments
+    :param section_emoji: Emoji to display in section header
+    :param section_title: Title text for the section
+    :param show_days_info: Whether to show days overdue/until due information
+    """
+    print("\n".join(_payment_section_lines(payments_by_date, section_emoji, section_title, show_days_info)))
 
 
 def _display_payment_overview(stats: PaymentStatistics, categorized: CategorizedPayments, upcoming_days: int) -> None:
     """
     Display payment overview information.
 
+    The whole overview is collected into a list of lines and written with a single print call.
+
     :param stats: Payment statistics
     :param categorized: Categorized payments
     :param upcoming_days: Number of days considered as upcoming
     """
-    print("Summary Statistics")
-    print("-" * 50)
     active_count = stats["total_plans"] - stats["fully_paid_count"]
-    print(f"Total Plans: {stats['total_plans']} ({stats['fully_paid_count']} fully paid, {active_count} active)")
-    print(f"Total Paid: {format_currency(stats['total_paid'])}")
-    print(f"Total Remaining: {format_currency(stats['total_remaining'])}")
-    print(f"Total Unpaid Installments: {stats['total_unpaid_installments']}")
-    print()
-
-    print("Payment Timeline")
-    print("-" * 50)
-    for days in sorted(stats["time_period_totals"].keys()):
-        total = stats["time_period_totals"][days]
-        print(f"Due in Next {days} Days: {format_currency(total)}")
-    print()
+    lines = [
+        "Summary Statistics",
+        SECTION_SEPARATOR,
+        f"Total Plans: {stats['total_plans']} ({stats['fully_paid_count']} fully paid, {active_count} active)",
+        f"Total Paid: {format_currency(stats['total_paid'])}",
+        f"Total Remaining: {format_currency(stats['total_remaining'])}",
+        f"Total Unpaid Installments: {stats['total_unpaid_installments']}",
+        "",
+        "Payment Timeline",
+        SECTION_SEPARATOR,
+    ]
+    for days, total in sorted(stats["time_period_totals"].items(), key=itemgetter(0)):
+        lines.append(f"Due in Next {days} Days: {format_currency(total)}")
+    lines.append("")
 
     if categorized["overdue"]:
         payments_by_date = group_payments_by_date(categorized["overdue"])
-        display_grouped_payments(payments_by_date, "⚠️", "OVERDUE PAYMENTS", show_days_info=True)
+        lines.extend(_payment_section_lines(payments_by_date, "⚠️", "OVERDUE PAYMENTS", show_days_info=True))
 
     if categorized["due_today"]:
         payments_by_date = group_payments_by_date(categorized["due_today"])
-        display_grouped_payments(payments_by_date, "🔔", "DUE TODAY", show_days_info=False)
+        lines.extend(_payment_section_lines(payments_by_date, "🔔", "DUE TODAY", show_days_info=False))
 
     if categorized["upcoming"]:
         upcoming_total = sum((p.installment.amount for p in categorized["upcoming"]), start=Decimal(0))
-        print(f"📅 UPCOMING (Next {upcoming_days} Days)")
-        print("-" * 50)
-        print(f"  Count: {len(categorized['upcoming'])}")
-        print(f"  Total: {format_currency(upcoming_total)}")
-        print()
+        lines.append(f"📅 UPCOMING (Next {upcoming_days} Days)")
+        lines.append(SECTION_SEPARATOR)
+        lines.append(f"  Count: {len(categorized['upcoming'])}")
+        lines.append(f"  Total: {format_currency(upcoming_total)}")
+        lines.append("")
         payments_by_date = group_payments_by_date(categorized["upcoming"])
-        for due_date, payments in payments_by_date.items():
-            if len(payments_by_date) > 1 or len(payments) > 1:
-                print(format_payment_date_header(due_date))
-
-            for payment in payments:
-                print(format_payment_item(payment, show_days_info=True))
-
-            if len(payments) > 1:
-                daily_total = sum((p.installment.amount for p in payments), start=Decimal(0))
-                print(format_daily_subtotal(daily_total))
-
-            if len(payments_by_date) > 1:
-                print()
-
-        if len(payments_by_date) == 1:
-            print()
+        lines.extend(_grouped_payment_lines(payments_by_date, show_days_info=True))
 
     if categorized["future"]:
         future_total = sum((p.installment.amount for p in categorized["future"]), start=Decimal(0))
-        print(f"Future Payments (Beyond {upcoming_days} Days)")
-        print("-" * 50)
-        print(f"  Count: {len(categorized['future'])}")
-        print(f"  Total: {format_currency(future_total)}")
-        print()
+        lines.append(f"Future Payments (Beyond {upcoming_days} Days)")
+        lines.append(SECTION_SEPARATOR)
+        lines.append(f"  Count: {len(categorized['future'])}")
+        lines.append(f"  Total: {format_currency(future_total)}")
+        lines.append("")
+
+    print("\n".join(lines))
 
 
-def overview(context: NavigationContext) -> CommandResult:
+def overview(context: AppContext) -> CommandResult:
     print_heading("Overview")
-    plan_manager = context.get_data(ContextKeys.PLAN_MANAGER)
+    plans_dict = context.plan_manager.list_plans()
 
-    if not plan_manager.has_plans():
+    if not plans_dict:
         return CommandResult(message="No installment plans found.")
 
     today = date.today()
     upcoming_days = 30
     time_periods = [7, 15, 30, 60]
-    plans_dict = plan_manager.list_plans()
-
-    for plan in plans_dict.values():
-        plan.update_overdue_status(today)
 
-    categorized = categorize_unpaid_installments(plans_dict, today, upcoming_days)
+    if all(plan.is_fully_paid for plan in plans_dict.values()):
+        categorized = CategorizedPayments(all_unpaid=[], overdue=[], due_today=[], upcoming=[], future=[])
+    else:
+        categorized = categorize_unpaid_installments(plans_dict, today, upcoming_days, update_overdue=True)
     stats = calculate_payment_statistics(plans_dict, categorized, time_periods)
     _display_payment_overview(stats, categorized, upcoming_days)
 
@@ -622,7 +677,7 @@ def _save_all_plans(plan_manager: PlanManager) -> tuple[int, list[str]]:
     return saved_count, errors
 
 
-def search_filter_plans(context: NavigationContext) -> CommandResult:
+def search_filter_plans(context: AppContext) -> CommandResult:
     """
     Search and filter installment plans with various criteria.
 
@@ -637,7 +692,7 @@ def search_filter_plans(context: NavigationContext) -> CommandResult:
     )
 
     print_heading("Search & Filter Plans")
-    plan_manager = context.get_data(ContextKeys.PLAN_MANAGER)
+    plan_manager = context.plan_manager
 
     if not plan_manager.plans:
         return CommandResult(message="No installment plans available.")
@@ -707,7 +762,7 @@ def search_filter_plans(context: NavigationContext) -> CommandResult:
         )
 
     print(f"\n{len(filtered_plans)} plan(s) found:")
-    print("-" * 50)
+    print(SECTION_SEPARATOR)
 
     if not filtered_plans:
         return CommandResult(message="No plans match the filter criteria.")
@@ -715,16 +770,18 @@ def search_filter_plans(context: NavigationContext) -> CommandResult:
     for plan in filtered_plans.values():
         status_icon = get_plan_status_icon(plan)
         overdue_marker = " ⚠" if plan.has_overdue_payments else ""
-        print(f"{status_icon} {plan.merchant_name}{overdue_marker}")
-        print(f"   Total: {format_currency(plan.total_amount)} | Remaining: {format_currency(plan.remaining_balance)}")
-        if plan.next_payment_due:
-            print(f"   Next payment: {plan.next_payment_due}")
-        print()
+        next_due = plan.next_payment_due
+        next_line = f"   Next payment: {next_due}\n" if next_due else ""
+        print(
+            f"{status_icon} {plan.merchant_name}{overdue_marker}\n"
+            f"   Total: {format_currency(plan.total_amount)} | Remaining: {format_currency(plan.remaining_balance)}\n"
+            f"{next_line}"
+        )
 
     return CommandResult(message=f"\nShowing {len(filtered_plans)} of {len(plan_manager.plans)} total plans.")
 
 
-def save_plans(context: NavigationContext) -> CommandResult:
+def save_plans(context: AppContext) -> CommandResult:
     """
     Save all installment plans to disk.
 
@@ -732,7 +789,7 @@ def save_plans(context: NavigationContext) -> CommandResult:
     :return: CommandResult with save status message
     """
     print_heading("Save Plans")
-    plan_manager = context.get_data(ContextKeys.PLAN_MANAGER)
+    plan_manager = context.plan_manager
 
     saved_count, _ = _save_all_plans(plan_manager)
 
@@ -742,7 +799,7 @@ def save_plans(context: NavigationContext) -> CommandResult:
     return CommandResult(message=f"\nSaved {saved_count} plan(s) to {plan_manager.storage_dir}")
 
 
-def load_plans(context: NavigationContext) -> CommandResult:
+def load_plans(context: AppContext) -> CommandResult:
     """
     Load all installment plans from disk.
 
@@ -750,7 +807,7 @@ def load_plans(context: NavigationContext) -> CommandResult:
     :return: CommandResult with load status message
     """
     print_heading("Load Plans")
-    plan_manager = context.get_data(ContextKeys.PLAN_MANAGER)
+    plan_manager = context.plan_manager
 
     loaded_count, errors = plan_manager.load_all()
 
@@ -763,7 +820,7 @@ def load_plans(context: NavigationContext) -> CommandResult:
     return CommandResult(message=f"\nLoaded {loaded_count} plan(s) from {plan_manager.storage_dir}")
 
 
-def export_plan_csv(context: NavigationContext) -> CommandResult:
+def export_plan_csv(context: AppContext) -> CommandResult:
     """
     Export a selected installment plan to CSV format.
 
@@ -777,40 +834,52 @@ def export_plan_csv(context: NavigationContext) -> CommandResult:
         return CommandResult(message="No plan selected.")
 
     plan_id, plan = result
-    plan_manager = context.get_data(ContextKeys.PLAN_MANAGER)
+    plan_manager = context.plan_manager
 
-    plan_manager.storage_dir.mkdir(exist_ok=True)
+    plan_manager.ensure_storage_dir()
 
     csv_path = plan_manager.get_plan_file_path(plan_id, "csv")
     try:
-        plan.to_csv(str(csv_path))
+        plan.to_csv(csv_path)
         return CommandResult(message=f"\nPlan exported to {csv_path}")
     except OSError as e:
         return CommandResult(message=f"Error exporting plan: {e}")
 
 
-def select_plan(context: NavigationContext, prompt: str = "Select plan number") -> tuple[str, InstallmentPlan] | None:
-    plan_manager = context.get_data(ContextKeys.PLAN_MANAGER)
+def _render_plan_choices(plan_ids: tuple[str, ...], plans_dict: dict[str, InstallmentPlan]) -> str:
+    """
+    Render the numbered plan list shown by plan pickers.
 
-    if not plan_manager.has_plans():
+    :param plan_ids: Plan IDs in display order; choice N selects plan_ids[N - 1]
+    :param plans_dict: Dictionary of plan_id -> InstallmentPlan
+    :return: Newline-joined list of numbered plan choices
+    """
+    return "\n".join(
+        f"{idx}. {plan_id} - {format_currency(plans_dict[plan_id].total_amount)} ({plans_dict[plan_id].merchant_name})"
+        for idx, plan_id in enumerate(plan_ids, 1)
+    )
+
+
+def select_plan(context: AppContext, prompt: str = "Select plan number") -> tuple[str, InstallmentPlan] | None:
+    plan_manager = context.plan_manager
+    plans_dict = plan_manager.list_plans()
+
+    if not plans_dict:
         print("No installment plans found.")
         return None
 
-    print("Available plans:")
-    plans_dict = plan_manager.list_plans()
-    plan_items = list(plans_dict.items())
-    for idx, (plan_id, plan) in enumerate(plan_items, 1):
-        print(f"{idx}. {plan_id} - {format_currency(plan.total_amount)} ({plan.merchant_name})")
+    plan_ids = plan_manager.list_plan_ids()
+    print(f"Available plans:\n{_render_plan_choices(plan_ids, plans_dict)}")
 
-    choice = get_int_input(f"\n{prompt}", min_val=1, max_val=len(plan_items))
+    choice = get_int_input(f"\n{prompt}", min_val=1, max_val=len(plan_ids))
     if choice is None:
         return None
 
-    plan_id, _ = plan_items[choice - 1]
-    return plan_id, plan_manager.get_plan(plan_id)
+    plan_id = plan_ids[choice - 1]
+    return plan_id, plans_dict[plan_id]
 
 
-def edit_merchant_name(context: NavigationContext) -> CommandResult:
+def edit_merchant_name(context: AppContext) -> CommandResult:
     """
     Edit the merchant name of the current plan.
 
@@ -818,9 +887,9 @@ def edit_merchant_name(context: NavigationContext) -> CommandResult:
     :return: CommandResult with update status message
     """
     print_heading("Edit Merchant Name")
-    plan_manager = context.get_data(ContextKeys.PLAN_MANAGER)
+    plan_manager = context.plan_manager
 
-    plan_id = context.get_data(ContextKeys.EDIT_PLAN_ID)
+    plan_id = context.edit_plan_id
     plan = plan_manager.get_plan(plan_id) if plan_id else None
 
     if not plan:
@@ -838,7 +907,7 @@ def edit_merchant_name(context: NavigationContext) -> CommandResult:
     if new_plan_id != plan_id:
         plan_manager.remove_plan(plan_id)
         plan_manager.add_plan(new_plan_id, plan)
-        context.set_data(ContextKeys.EDIT_PLAN_ID, new_plan_id)
+        context.edit_plan_id = new_plan_id
     else:
         plan_manager.mark_as_modified()
 
@@ -846,7 +915,7 @@ def edit_merchant_name(context: NavigationContext) -> CommandResult:
 
 
 def _edit_installment_field(
-    context: NavigationContext,
+    context: AppContext,
     heading: str,
     field_name: str,
     get_current_value: Callable[[Installment], Any],
@@ -870,10 +939,10 @@ def _edit_installment_field(
     :param select_installment_fn: Optional function(plan) -> installment for custom selection logic
     :return: CommandResult
     """
-    print(f"\n=== {heading} ===\n")
-    plan_manager = context.get_data(ContextKeys.PLAN_MANAGER)
+    print_heading(heading)
+    plan_manager = context.plan_manager
 
-    plan_id = context.get_data(ContextKeys.EDIT_PLAN_ID)
+    plan_id = context.edit_plan_id
     plan = plan_manager.get_plan(plan_id) if plan_id else None
 
     if not plan:
@@ -905,7 +974,7 @@ def _edit_installment_field(
     return CommandResult(message=success_msg)
 
 
-def edit_installment_amount(context: NavigationContext) -> CommandResult:
+def edit_installment_amount(context: AppContext) -> CommandResult:
     """
     Edit the amount of a specific installment.
 
@@ -932,7 +1001,7 @@ def edit_installment_amount(context: NavigationContext) -> CommandResult:
     )
 
 
-def edit_installment_due_date(context: NavigationContext) -> CommandResult:
+def edit_installment_due_date(context: AppContext) -> CommandResult:
     """Edit the due date of a specific installment"""
 
     def apply_due_date_update(plan, installment, new_due_date):
@@ -953,25 +1022,24 @@ def edit_installment_due_date(context: NavigationContext) -> CommandResult:
 
 def _select_paid_installment(plan: InstallmentPlan) -> Installment | None:
     """Select from paid installments only, showing paid dates."""
-    paid_installments = [inst for inst in plan.installments if inst.status == PaymentStatus.PAID]
-
-    if not paid_installments:
+    paid_lines = [
+        f"  {inst.installment_number}. Installment #{inst.installment_number}: {format_currency(inst.amount)}"
+        f" - Paid on {inst.paid_date}"
+        for inst in plan.installments
+        if inst.status == PaymentStatus.PAID
+    ]
+
+    if not paid_lines:
         print("No paid installments to edit.")
         return None
 
-    print("Paid installments:")
-    for inst in paid_installments:
-        print(
-            f"  {inst.installment_number}. Installment #{inst.installment_number}: {format_currency(inst.amount)}"
-            f" - Paid on {inst.paid_date}"
-        )
+    print("Paid installments:\n" + "\n".join(paid_lines))
 
     inst_num = get_int_input("\nSelect installment number to edit", min_val=1, max_val=plan.num_installments)
     if not inst_num:
         return None
 
-    selected_inst = plan.installments[inst_num - 1]
-
+    selected_inst = plan.get_installment(inst_num)
     if selected_inst.status != PaymentStatus.PAID:
         print(f"Installment #{inst_num} is not marked as paid.")
         return None
@@ -979,7 +1047,7 @@ def _select_paid_installment(plan: InstallmentPlan) -> Installment | None:
     return selected_inst
 
 
-def edit_installment_paid_date(context: NavigationContext) -> CommandResult:
+def edit_installment_paid_date(context: AppContext) -> CommandResult:
     """
     Edit the paid date of an already-paid installment.
 
@@ -1004,7 +1072,7 @@ def edit_installment_paid_date(context: NavigationContext) -> CommandResult:
     )
 
 
-def edit_installment_amount_paid(context: NavigationContext) -> CommandResult:
+def edit_installment_amount_paid(context: AppContext) -> CommandResult:
     """
     Edit the amount paid for an installment.
 
@@ -1012,9 +1080,9 @@ def edit_installment_amount_paid(context: NavigationContext) -> CommandResult:
     :return: CommandResult with update status message
     """
     print_heading("Edit Installment Amount Paid")
-    plan_manager = context.get_data(ContextKeys.PLAN_MANAGER)
+    plan_manager = context.plan_manager
 
-    plan_id = context.get_data(ContextKeys.EDIT_PLAN_ID)
+    plan_id = context.edit_plan_id
     plan = plan_manager.get_plan(plan_id) if plan_id else None
 
     if not plan:
@@ -1058,7 +1126,7 @@ def edit_installment_amount_paid(context: NavigationContext) -> CommandResult:
     )
 
 
-def delete_plan(context: NavigationContext) -> CommandResult:
+def delete_plan(context: AppContext) -> CommandResult:
     """
     Delete the current installment plan after confirmation.
 
@@ -1066,9 +1134,9 @@ def delete_plan(context: NavigationContext) -> CommandResult:
     :return: CommandResult with deletion status and POP_TO_ROOT action
     """
     print_heading("Delete Plan")
-    plan_manager = context.get_data(ContextKeys.PLAN_MANAGER)
+    plan_manager = context.plan_manager
 
-    plan_id = context.get_data(ContextKeys.EDIT_PLAN_ID)
+    plan_id = context.edit_plan_id
     plan = plan_manager.get_plan(plan_id) if plan_id else None
 
     if not plan:
@@ -1084,12 +1152,12 @@ def delete_plan(context: NavigationContext) -> CommandResult:
         return CommandResult(message="Deletion cancelled.")
 
     plan_manager.remove_plan(plan_id)
-    context.clear_data("edit_plan_id")
+    context.edit_plan_id = None
 
     return CommandResult(action=NavigationAction.POP, message=f"\nPlan '{plan_id}' deleted successfully.")
 
 
-def edit_plan_menu(context: NavigationContext) -> CommandResult:
+def edit_plan_menu(context: AppContext) -> CommandResult:
     """
     Display menu for editing a selected installment plan.
 
@@ -1104,7 +1172,7 @@ def edit_plan_menu(context: NavigationContext) -> CommandResult:
 
     plan_id, plan = result
 
-    context.set_data(ContextKeys.EDIT_PLAN_ID, plan_id)
+    context.edit_plan_id = plan_id
 
     print(f"\nEditing plan: {plan.merchant_name}")
     print(f"Total: {format_currency(plan.total_amount)}")
@@ -1123,14 +1191,14 @@ def edit_plan_menu(context: NavigationContext) -> CommandResult:
     return CommandResult(action=NavigationAction.PUSH, target_menu=edit_menu)
 
 
-def save_and_exit(context: NavigationContext) -> CommandResult:
+def save_and_exit(context: AppContext) -> CommandResult:
     """
     Save all plans and exit the application.
 
     :param context: Navigation context containing plan manager
     :return: CommandResult with EXIT action
     """
-    plan_manager = context.get_data(ContextKeys.PLAN_MANAGER)
+    plan_manager = context.plan_manager
 
     saved_count, _ = _save_all_plans(plan_manager)
     if saved_count > 0:
@@ -1139,21 +1207,21 @@ def save_and_exit(context: NavigationContext) -> CommandResult:
     return CommandResult(action=NavigationAction.EXIT)
 
 
-def exit_without_saving(context: NavigationContext) -> CommandResult:
+def exit_without_saving(context: AppContext) -> CommandResult:
     """
     Exit the application with confirmation if there are unsaved changes.
 
     :param context: Navigation context
     :return: CommandResult with EXIT action or NONE to cancel
     """
-    plan_manager: PlanManager = context.get_data(ContextKeys.PLAN_MANAGER)
+    plan_manager = context.plan_manager
 
     if not plan_manager.has_unsaved_changes():
         return CommandResult(action=NavigationAction.EXIT)
 
-    print("\n" + "=" * 50)
+    print(f"\n{WARNING_SEPARATOR}")
     print("WARNING: You have unsaved changes!")
-    print("=" * 50)
+    print(WARNING_SEPARATOR)
     print("\nWhat would you like to do?")
     print("  1. Save and exit")
     print("  2. Exit without saving")
@@ -1187,8 +1255,7 @@ def main() -> None:
 
     plan_manager = PlanManager(storage_dir)
 
-    context = NavigationContext()
-    context.set_data(ContextKeys.PLAN_MANAGER, plan_manager)
+    context = AppContext(plan_manager)
 
     main_menu = Menu("Installment Plan Tracker")
     main_menu.add_command("o", Command("Overview", overview))
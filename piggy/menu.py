@@ -1,8 +1,10 @@
 import inspect
 from abc import ABC, abstractmethod
+from bisect import insort
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum, auto
+from operator import itemgetter
 from typing import Any, Optional
 
 from piggy.utils.error_handler import format_error_for_category, get_error_category
@@ -18,50 +20,45 @@ class NavigationAction(Enum):
 
 
 class NavigationContext:
+    __slots__ = ("_menu_stack", "_breadcrumb", "_last_result")
+
     def __init__(self):
         self._menu_stack: list[Menu] = []
-        self._shared_data: dict[str, Any] = {}
+        self._breadcrumb = ""
         self._last_result: CommandResult | None = None
 
+    def _update_breadcrumb(self):
+        """Rebuild the breadcrumb after the menu stack changes."""
+        self._breadcrumb = " > ".join(menu.title for menu in self._menu_stack)
+
     def push_menu(self, menu: "Menu"):
         self._menu_stack.append(menu)
+        self._update_breadcrumb()
 
     def pop_menu(self) -> Optional["Menu"]:
         if len(self._menu_stack) > 1:
             self._menu_stack.pop()
+            self._update_breadcrumb()
             return self.get_current_menu()
         return None
 
     def pop_menu_to_root(self):
         if self._menu_stack:
-            self._menu_stack = [self._menu_stack[0]]
+            del self._menu_stack[1:]
+            self._update_breadcrumb()
 
     def replace_menu(self, menu: "Menu"):
         if self._menu_stack:
             self._menu_stack[-1] = menu
         else:
             self._menu_stack.append(menu)
+        self._update_breadcrumb()
 
     def get_current_menu(self) -> Optional["Menu"]:
         return self._menu_stack[-1] if self._menu_stack else None
 
     def get_breadcrumb(self) -> str:
-        if not self._menu_stack:
-            return ""
-        return " > ".join(menu.title for menu in self._menu_stack)
-
-    def set_data(self, key: str, value: Any):
-        self._shared_data[key] = value
-
-    def get_data(self, key: str, default: Any = None) -> Any:
-        return self._shared_data.get(key, default)
-
-    def clear_data(self, *keys: str):
-        if keys:
-            for key in keys:
-                self._shared_data.pop(key, None)
-        else:
-            self._shared_data.clear()
+        return self._breadcrumb
 
     def set_last_result(self, result: "CommandResult"):
         """Store the last command result for access by parent menus."""
@@ -78,7 +75,7 @@ class NavigationContext:
         self._last_result = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CommandResult:
     action: NavigationAction = NavigationAction.NONE
     target_menu: Optional["Menu"] = None
@@ -87,9 +84,15 @@ class CommandResult:
     wait_for_key: bool = False
 
 
+_BACK_RESULT = CommandResult(NavigationAction.POP)
+_EXIT_RESULT = CommandResult(NavigationAction.EXIT)
+
+
 class BaseCommand(ABC):
     """Base class for a command option in a menu interface."""
 
+    __slots__ = ()
+
     @abstractmethod
     def execute(self, context: NavigationContext) -> CommandResult:
         pass
@@ -100,6 +103,8 @@ class BaseCommand(ABC):
 
 
 class Command(BaseCommand):
+    __slots__ = ("_description", "_execute_fn", "_needs_context")
+
     def __init__(
         self, description: str, execute_fn: Callable[[NavigationContext], CommandResult] | Callable[[], CommandResult]
     ):
@@ -120,22 +125,32 @@ class Command(BaseCommand):
 
 
 class BackCommand(BaseCommand):
+    __slots__ = ()
+
     def execute(self, context: NavigationContext) -> CommandResult:
-        return CommandResult(NavigationAction.POP)
+        return _BACK_RESULT
 
     def description(self) -> str:
         return "Back"
 
 
 class ExitCommand(BaseCommand):
+    __slots__ = ()
+
     def execute(self, context: NavigationContext) -> CommandResult:
-        return CommandResult(NavigationAction.EXIT)
+        return _EXIT_RESULT
 
     def description(self) -> str:
         return "Exit"
 
 
+BACK_COMMAND = BackCommand()
+EXIT_COMMAND = ExitCommand()
+
+
 class SubMenuCommand(BaseCommand):
+    __slots__ = ("_menu",)
+
     def __init__(self, menu: "Menu"):
         self._menu = menu
 
@@ -150,6 +165,8 @@ class SubMenuCommand(BaseCommand):
 
 
 class Menu:
+    __slots__ = ("_title", "_commands", "_order", "_sort_commands", "_display_text")
+
     def __init__(self, title: str, sort_commands: bool = False):
         """
         Initialize a menu.
@@ -160,7 +177,9 @@ class Menu:
         """
         self._title = title
         self._commands: dict[str, BaseCommand] = {}
+        self._order: list[tuple[str, BaseCommand]] = []
         self._sort_commands = sort_commands
+        self._display_text: str | None = None
 
     @property
     def title(self) -> str:
@@ -170,24 +189,28 @@ class Menu:
         if key in self._commands:
             raise KeyError(f'Command "{key}" already exists')
         self._commands[key] = command
+        if self._sort_commands:
+            insort(self._order, (key, command), key=itemgetter(0))
+        else:
+            self._order.append((key, command))
+        self._display_text = None
 
     def add_submenu(self, key: str, submenu: "Menu"):
         self.add_command(key, SubMenuCommand(submenu))
 
     def add_back_command(self, key: str = "b"):
-        self.add_command(key, BackCommand())
+        self.add_command(key, BACK_COMMAND)
 
     def display(self):
-        print(f"{self._title}")
-
-        items = sorted(self._commands.items()) if self._sort_commands else self._commands.items()
-        for key, command in items:
-            print(f"{key}. {command.description()}")
+        if self._display_text is None:
+            lines = [self._title]
+            lines.extend(f"{key}. {command.description()}" for key, command in self._order)
+            self._display_text = "\n".join(lines)
+        print(self._display_text)
 
     def handle_input(self, choice: str, context: NavigationContext) -> CommandResult:
-        if choice in self._commands:
-            command = self._commands[choice]
-
+        command = self._commands.get(choice)
+        if command is not None:
             try:
                 return command.execute(context)
             except KeyboardInterrupt:
@@ -212,9 +235,38 @@ class Menu:
 
 
 class MenuInterface:
+    __slots__ = ("_context", "_action_handlers")
+
     def __init__(self, start_menu: Menu, context: NavigationContext | None = None):
         self._context = context if context is not None else NavigationContext()
         self._context.push_menu(start_menu)
+        self._action_handlers: dict[NavigationAction, Callable[[CommandResult], bool]] = {
+            NavigationAction.EXIT: self._handle_exit,
+            NavigationAction.PUSH: self._handle_push,
+            NavigationAction.POP: self._handle_pop,
+            NavigationAction.POP_TO_ROOT: self._handle_pop_to_root,
+            NavigationAction.REPLACE: self._handle_replace,
+        }
+
+    def _handle_exit(self, result: CommandResult) -> bool:
+        return True
+
+    def _handle_push(self, result: CommandResult) -> bool:
+        if result.target_menu:
+            self._context.push_menu(result.target_menu)
+        return False
+
+    def _handle_pop(self, result: CommandResult) -> bool:
+        return not self._context.pop_menu()
+
+    def _handle_pop_to_root(self, result: CommandResult) -> bool:
+        self._context.pop_menu_to_root()
+        return False
+
+    def _handle_replace(self, result: CommandResult) -> bool:
+        if result.target_menu:
+            self._context.replace_menu(result.target_menu)
+        return False
 
     def run(self) -> Any:
         """Run the menu interface loop"""
@@ -243,21 +295,9 @@ class MenuInterface:
             if result.wait_for_key:
                 input("Press Enter to continue...")
 
-            match result.action:
-                case NavigationAction.EXIT:
-                    break
-                case NavigationAction.PUSH:
-                    if result.target_menu:
-                        self._context.push_menu(result.target_menu)
-                case NavigationAction.POP:
-                    if not self._context.pop_menu():
-                        break
-                case NavigationAction.POP_TO_ROOT:
-                    self._context.pop_menu_to_root()
-                case NavigationAction.REPLACE:
-                    if result.target_menu:
-                        self._context.replace_menu(result.target_menu)
-                case NavigationAction.NONE:
-                    pass
+            # NavigationAction.NONE has no handler and keeps the current menu
+            handler = self._action_handlers.get(result.action)
+            if handler and handler(result):
+                break
 
         return final_return_value
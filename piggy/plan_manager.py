@@ -1,7 +1,12 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from piggy.installment_plan import InstallmentPlan
 
+# Same cap ThreadPoolExecutor uses by default for I/O-bound work
+MAX_IO_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
 
 class PlanManager:
     """
@@ -19,6 +24,8 @@ class PlanManager:
         """
         self.storage_dir = storage_dir
         self.plans: dict[str, InstallmentPlan] = {}
+        self._plan_ids: tuple[str, ...] | None = None
+        self._file_paths: dict[tuple[str, str], Path] = {}
         self._has_unsaved_changes = False
 
     def add_plan(self, plan_id: str, plan: InstallmentPlan) -> None:
@@ -28,6 +35,8 @@ class PlanManager:
         :param plan_id: Unique identifier for the plan
         :param plan: InstallmentPlan instance to store
         """
+        if plan_id not in self.plans:
+            self._plan_ids = None
         self.plans[plan_id] = plan
         self._has_unsaved_changes = True
 
@@ -49,6 +58,8 @@ class PlanManager:
         """
         if plan_id in self.plans:
             del self.plans[plan_id]
+            self._plan_ids = None
+            self._file_paths = {key: path for key, path in self._file_paths.items() if key[0] != plan_id}
             self._has_unsaved_changes = True
             return True
         return False
@@ -61,6 +72,18 @@ class PlanManager:
         """
         return self.plans
 
+    def list_plan_ids(self) -> tuple[str, ...]:
+        """
+        Get all plan IDs in insertion order.
+
+        The tuple is cached and only rebuilt after plans are added or removed.
+
+        :return: Tuple of plan IDs
+        """
+        if self._plan_ids is None:
+            self._plan_ids = tuple(self.plans)
+        return self._plan_ids
+
     def has_plans(self) -> bool:
         """
         Check if any plans are stored.
@@ -73,11 +96,21 @@ class PlanManager:
         """
         Get file path for a plan.
 
+        Paths are built once per plan and extension and reused on later saves and exports.
+
         :param plan_id: Plan identifier
         :param extension: File extension (e.g., 'json', 'csv')
         :return: Path object for the plan file
         """
-        return self.storage_dir / f"{plan_id}.{extension}"
+        key = (plan_id, extension)
+        file_path = self._file_paths.get(key)
+        if file_path is None:
+            file_path = self._file_paths[key] = self.storage_dir / f"{plan_id}.{extension}"
+        return file_path
+
+    def ensure_storage_dir(self) -> None:
+        """Create the storage directory if it does not exist."""
+        self.storage_dir.mkdir(exist_ok=True)
 
     def has_unsaved_changes(self) -> bool:
         """
@@ -95,16 +128,25 @@ class PlanManager:
         """
         Save all plans to disk.
 
+        Files are written concurrently on a small thread pool; errors are reported in plan order.
+
         :return: Tuple of (saved_count, error_messages)
         """
-        self.storage_dir.mkdir(exist_ok=True)
+        self.ensure_storage_dir()
         saved_count = 0
         errors = []
 
-        for plan_id, plan in self.plans.items():
+        if not self.plans:
+            return saved_count, errors
+
+        with ThreadPoolExecutor(max_workers=min(MAX_IO_WORKERS, len(self.plans))) as executor:
+            futures = [
+                (plan_id, executor.submit(self._write_plan_file, plan_id, plan)) for plan_id, plan in self.plans.items()
+            ]
+
+        for plan_id, future in futures:
             try:
-                file_path = self.get_plan_file_path(plan_id, "json")
-                plan.to_json(str(file_path))
+                future.result()
                 saved_count += 1
             except OSError as e:
                 errors.append(f"Error saving {plan_id}: {e}")
@@ -118,25 +160,43 @@ class PlanManager:
         """
         Load all plans from disk.
 
+        Files are read and parsed concurrently on a small thread pool; plans are added in file order.
+
         :return: Tuple of (loaded_count, error_messages)
         """
-        if not self.storage_dir.exists():
+        try:
+            with os.scandir(self.storage_dir) as entries:
+                json_entries = [entry for entry in entries if entry.name.endswith(".json") and entry.is_file()]
+        except (FileNotFoundError, NotADirectoryError):
             return 0, []
 
-        json_files = list(self.storage_dir.glob("*.json"))
-        if not json_files:
+        if not json_entries:
             return 0, []
 
         loaded_count = 0
         errors = []
 
-        for file_path in json_files:
+        with ThreadPoolExecutor(max_workers=min(MAX_IO_WORKERS, len(json_entries))) as executor:
+            futures = [(entry, executor.submit(InstallmentPlan.from_json_file, entry.path)) for entry in json_entries]
+
+        for entry, future in futures:
             try:
-                plan = InstallmentPlan.from_json_file(str(file_path))
-                plan_id = file_path.stem
-                self.plans[plan_id] = plan
+                plan = future.result()
+                self.plans[entry.name.removesuffix(".json")] = plan
+                self._plan_ids = None
                 loaded_count += 1
             except (OSError, ValueError) as e:
-                errors.append(f"Error loading {file_path.name}: {e}")
+                errors.append(f"Error loading {entry.name}: {e}")
 
         return loaded_count, errors
+
+    def _write_plan_file(self, plan_id: str, plan: InstallmentPlan) -> None:
+        """
+        Write a single plan to its JSON file.
+
+        :param plan_id: Plan identifier
+        :param plan: InstallmentPlan to write
+        :raises OSError: If the file cannot be written
+        """
+        file_path = self.get_plan_file_path(plan_id, "json")
+        file_path.write_text(plan.to_json(), encoding="utf-8")
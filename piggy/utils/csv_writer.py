@@ -1,11 +1,20 @@
 """CSV writing utilities for clean and consistent CSV export."""
 
 import csv
+from collections.abc import Callable, Iterable
 from datetime import date, datetime
 from decimal import Decimal
 from io import StringIO
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
+
+_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    Decimal: str,
+    bool: str,
+    type(None): lambda _: "",
+}
 
 
 def format_value(value: Any) -> str:
@@ -13,36 +22,51 @@ def format_value(value: Any) -> str:
     Format a value for CSV output.
 
     Handles datetime, date, Decimal, bool, and None types with appropriate formatting.
+    Exact types are dispatched through a lookup table; date subclasses fall back to isinstance.
 
     :param value: Value to format
     :return: Formatted string representation
     """
-    if isinstance(value, datetime | date):
+    formatter = _FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+    if isinstance(value, date):
         return value.isoformat()
-    elif isinstance(value, Decimal | bool):
-        return str(value)
-    elif value is None:
-        return ""
     return str(value)
 
 
-def write_csv_from_dicts(headers: list[str], rows: list[dict[str, Any]], file_path: str | None = None) -> str:
+def write_csv_from_dicts(
+    headers: list[str], rows: Iterable[dict[str, Any]], file_path: str | Path | None = None
+) -> str | None:
     """
-    Write CSV from list of dictionaries.
+    Write CSV from an iterable of dictionaries.
+
+    When a file path is given, rows are streamed straight to the file instead of being
+    buffered in memory first.
 
     :param headers: List of column headers
-    :param rows: List of dictionaries containing row data
+    :param rows: Iterable of dictionaries containing row data, consumed once
     :param file_path: Optional file path to save CSV
-    :return: CSV content as string
+    :return: CSV content as string if no file_path is given, otherwise None
     """
+    if file_path:
+        with open(file_path, "w", newline="", encoding="utf-8") as file:
+            _write_rows(file, headers, rows)
+        return None
+
     output = StringIO()
-    writer = csv.DictWriter(output, fieldnames=headers)
-    writer.writeheader()
-    writer.writerows(rows)
+    _write_rows(output, headers, rows)
+    return output.getvalue()
 
-    csv_content = output.getvalue()
 
-    if file_path:
-        Path(file_path).write_text(csv_content, encoding="utf-8")
+def _write_rows(file: TextIO, headers: list[str], rows: Iterable[dict[str, Any]]) -> None:
+    """
+    Write the header and rows to an open text stream.
 
-    return csv_content
+    :param file: Text stream to write to
+    :param headers: List of column headers
+    :param rows: Iterable of dictionaries containing row data
+    """
+    writer = csv.DictWriter(file, fieldnames=headers)
+    writer.writeheader()
+    writer.writerows(rows)
@@ -1,5 +1,7 @@
 import traceback
-from io import StringIO
+from collections.abc import Callable
+
+ERROR_SEPARATOR = "=" * 50
 
 
 def format_error_message(exception: Exception, include_traceback: bool = False) -> str:
@@ -11,41 +13,58 @@ def format_error_message(exception: Exception, include_traceback: bool = False)
     :return: Formatted error message string
     """
     if include_traceback:
-        tb_output = StringIO()
-        traceback.print_exc(file=tb_output)
-        tb_string = tb_output.getvalue()
-
-        lines = [
-            "",
-            "=" * 50,
-            "UNEXPECTED ERROR - Please report this issue",
-            "=" * 50,
-            tb_string.rstrip(),
-            "=" * 50,
-            "",
-        ]
-        return "\n".join(lines)
+        tb_string = traceback.format_exc().rstrip()
+        return (
+            f"\n{ERROR_SEPARATOR}\nUNEXPECTED ERROR - Please report this issue\n{ERROR_SEPARATOR}\n"
+            f"{tb_string}\n{ERROR_SEPARATOR}\n"
+        )
     else:
         return f"Error: {exception}"
 
 
-def get_error_category(exception: Exception) -> str:
+def _categorize_type(exception_type: type[BaseException]) -> str:
     """
-    Categorize an exception to determine handling strategy.
+    Categorize an exception type.
 
-    :param exception: The exception to categorize
+    :param exception_type: The exception class to categorize
     :return: Category string: 'expected', 'io', 'interrupt', or 'unexpected'
     """
-    if isinstance(exception, ValueError | KeyError | FileNotFoundError):
+    if issubclass(exception_type, ValueError | KeyError | FileNotFoundError):
         return "expected"
-    elif isinstance(exception, OSError | IOError):
+    elif issubclass(exception_type, OSError):
         return "io"
-    elif isinstance(exception, KeyboardInterrupt):
+    elif issubclass(exception_type, KeyboardInterrupt):
         return "interrupt"
     else:
         return "unexpected"
 
 
+_category_by_type: dict[type[BaseException], str] = {}
+
+
+def get_error_category(exception: Exception) -> str:
+    """
+    Categorize an exception to determine handling strategy.
+
+    The category is resolved once per exception type and then looked up by type.
+
+    :param exception: The exception to categorize
+    :return: Category string: 'expected', 'io', 'interrupt', or 'unexpected'
+    """
+    exception_type = type(exception)
+    category = _category_by_type.get(exception_type)
+    if category is None:
+        category = _category_by_type[exception_type] = _categorize_type(exception_type)
+    return category
+
+
+_CATEGORY_FORMATTERS: dict[str, Callable[[Exception], str]] = {
+    "expected": lambda exception: f"Error: {exception}",
+    "io": lambda exception: f"File operation failed: {exception}",
+    "unexpected": lambda exception: format_error_message(exception, include_traceback=True),
+}
+
+
 def format_error_for_category(exception: Exception, category: str) -> str:
     """
     Format error message based on category.
@@ -54,11 +73,5 @@ def format_error_for_category(exception: Exception, category: str) -> str:
     :param category: Error category from get_error_category()
     :return: Formatted error message
     """
-    if category == "expected":
-        return f"Error: {exception}"
-    elif category == "io":
-        return f"File operation failed: {exception}"
-    elif category == "unexpected":
-        return format_error_message(exception, include_traceback=True)
-    else:
-        return str(exception)
+    formatter = _CATEGORY_FORMATTERS.get(category, str)
+    return formatter(exception)
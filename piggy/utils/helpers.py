@@ -1,6 +1,8 @@
+from functools import cache
 from pathlib import Path
 
 
+@cache
 def get_project_root() -> Path:
     """
     Returns the root directory containing the Python project.
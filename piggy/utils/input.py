@@ -47,9 +47,9 @@ def get_decimal_input(prompt: str, default: Decimal | None = None) -> Decimal |
     :return: The user's decimal input, or the default value if empty input is provided,
              or None otherwise.
     """
+    prompt_text = f"{prompt} [{default}]: " if default is not None else f"{prompt}: "
     while True:
         try:
-            prompt_text = f"{prompt} [{default}]: " if default is not None else f"{prompt}: "
             value = input(prompt_text).strip()
 
             if not value:
@@ -78,16 +78,12 @@ def get_date_input(prompt: str, default: date | None = None) -> date | None:
     :return: The user's date input, or the default value if empty
              input is provided, or None if no default is set and the user enters nothing.
     """
+    prompt_text = f"{prompt} (YYYY-MM-DD) [{default}]: " if default is not None else f"{prompt} (YYYY-MM-DD): "
     while True:
         try:
-            if default is not None:
-                value = input(f"{prompt} (YYYY-MM-DD) [{default}]: ").strip()
-                if not value:
-                    return default
-            else:
-                value = input(f"{prompt} (YYYY-MM-DD): ").strip()
-                if not value:
-                    return None
+            value = input(prompt_text).strip()
+            if not value:
+                return default
             return date.fromisoformat(value)
         except ValueError:
             print("Invalid date format. Please use YYYY-MM-DD.")
@@ -126,14 +122,18 @@ def get_int_input(
         if max_val is not None and default > max_val:
             raise ValueError(f"Default value {default} is greater than the maximum value {max_val}.")
 
+    prompt_text = f"{prompt} ({default}): " if default else f"{prompt}: "
     while True:
         try:
-            prompt_text = f"{prompt} ({default}): " if default else f"{prompt}: "
             value = input(prompt_text).strip()
 
             if not value:
                 return default
 
+            if not value.lstrip("+-").isdigit():
+                print("Invalid number. Please enter a valid integer.")
+                continue
+
             int_val = int(value)
 
             if min_val is not None and int_val < min_val:
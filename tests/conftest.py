@@ -0,0 +1,28 @@
+"""
+Shared pytest fixtures for the test suite.
+"""
+
+import copy
+
+import pytest
+
+from piggy.installment_plan import InstallmentPlan
+
+
+@pytest.fixture(scope="session")
+def make_plan():
+    """
+    Factory fixture building plans once per distinct set of arguments.
+
+    Each call returns a deep copy of the cached plan, so tests remain free to mutate it. Tests exercising
+    InstallmentPlan.build itself should call it directly instead.
+    """
+    cache: dict[tuple, InstallmentPlan] = {}
+
+    def _make(**kwargs) -> InstallmentPlan:
+        key = tuple(sorted(kwargs.items()))
+        if key not in cache:
+            cache[key] = InstallmentPlan.build(**kwargs)
+        return copy.deepcopy(cache[key])
+
+    return _make
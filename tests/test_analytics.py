@@ -2,205 +2,228 @@
 Pytest tests for analytics module.
 """
 
+import copy
 from datetime import date
 from decimal import Decimal
 
 import pytest
 
 from piggy.analytics import (
+    calculate_payment_statistics,
+    categorize_unpaid_installments,
     filter_plans_by_amount,
+    filter_plans_by_date,
     filter_plans_by_merchant,
     filter_plans_by_status,
 )
 from piggy.installment_plan import InstallmentPlan, PaymentStatus
 
+# analytics is pure logic, so any warning raised while it runs is treated as a failure
+pytestmark = pytest.mark.filterwarnings("error")
+
+# Dates shared by the fixture plans (date objects are immutable, so one instance serves every plan)
+_JAN_1 = date(2024, 1, 1)
+_JAN_5 = date(2024, 1, 5)
+_JAN_15 = date(2024, 1, 15)
+_FEB_1 = date(2024, 2, 1)
+_FEB_15 = date(2024, 2, 15)
+_MAR_1 = date(2024, 3, 1)
+_APR_1 = date(2024, 4, 1)
+
+# Build arguments shared by every fixture plan unless overridden
+_BASE_BUILD_KWARGS = {"purchase_date": _JAN_1, "days_between": 30}
+
+
+def _build(
+    merchant_name: str,
+    total_cents: int,
+    num_installments: int,
+    first_payment_date: date,
+    statuses: list[PaymentStatus] | None = None,
+    **overrides,
+) -> InstallmentPlan:
+    """
+    Build a fixture plan from an integer cent total, avoiding Decimal string parsing in fixtures.
+
+    :param statuses: Optional initial status for each installment, assigned in installment order
+    :param overrides: Build arguments replacing the shared defaults, e.g. purchase_date
+    """
+    plan = InstallmentPlan.build(
+        **(_BASE_BUILD_KWARGS | overrides),
+        merchant_name=merchant_name,
+        total_amount=Decimal(total_cents).scaleb(-2),
+        num_installments=num_installments,
+        first_payment_date=first_payment_date,
+    )
+    if statuses is not None:
+        for inst, status in zip(plan.installments, statuses, strict=True):
+            inst.status = status
+    return plan
 
-@pytest.fixture
-def sample_plans():
-    """Fixture providing sample plans for testing."""
+
+@pytest.fixture(scope="session")
+def _sample_plans_template():
+    """Sample plans, built once per session."""
     return {
-        "plan1": InstallmentPlan.build(
-            merchant_name="Apple Store",
-            total_amount=Decimal("1200.00"),
-            purchase_date=date(2024, 1, 1),
+        "plan1": _build(
+            "Apple Store",
+            total_cents=120000,
             num_installments=4,
-            days_between=30,
-            first_payment_date=date(2024, 2, 1),
+            first_payment_date=_FEB_1,
         ),
-        "plan2": InstallmentPlan.build(
-            merchant_name="Best Buy",
-            total_amount=Decimal("900.00"),
-            purchase_date=date(2024, 1, 15),
+        "plan2": _build(
+            "Best Buy",
+            total_cents=90000,
+            purchase_date=_JAN_15,
             num_installments=3,
-            days_between=30,
-            first_payment_date=date(2024, 2, 15),
+            first_payment_date=_FEB_15,
         ),
-        "plan3": InstallmentPlan.build(
-            merchant_name="Amazon",
-            total_amount=Decimal("500.00"),
-            purchase_date=date(2024, 2, 1),
+        "plan3": _build(
+            "Amazon",
+            total_cents=50000,
+            purchase_date=_FEB_1,
             num_installments=2,
-            days_between=30,
-            first_payment_date=date(2024, 3, 1),
+            first_payment_date=_MAR_1,
         ),
     }
 
 
+@pytest.fixture
+def sample_plans(_sample_plans_template):
+    """Fixture providing a per-test copy of the sample plans."""
+    return copy.deepcopy(_sample_plans_template)
+
+
 @pytest.mark.unit
 class TestFilterPlansByMerchant:
     """Tests for merchant name filtering."""
 
-    def test_exact_match(self, sample_plans):
-        """Test exact merchant name match."""
-        result = filter_plans_by_merchant(sample_plans, "Apple Store")
-        assert len(result) == 1
-        assert "plan1" in result
-
-    def test_partial_match(self, sample_plans):
-        """Test partial merchant name match."""
-        result = filter_plans_by_merchant(sample_plans, "Buy")
-        assert len(result) == 1
-        assert "plan2" in result
-
-    def test_case_insensitive(self, sample_plans):
-        """Test case-insensitive matching."""
-        result = filter_plans_by_merchant(sample_plans, "apple")
-        assert len(result) == 1
-        assert "plan1" in result
-
-    def test_no_match(self, sample_plans):
-        """Test no matching merchants."""
-        result = filter_plans_by_merchant(sample_plans, "Nonexistent Store")
-        assert len(result) == 0
-
-    def test_multiple_matches(self, sample_plans):
-        """Test query matching multiple merchants."""
-        result = filter_plans_by_merchant(sample_plans, "A")
-        assert len(result) == 2
-        assert "plan1" in result
-        assert "plan3" in result
-
-    def test_empty_query(self, sample_plans):
-        """Test empty query returns all plans."""
-        result = filter_plans_by_merchant(sample_plans, "")
-        assert len(result) == 3
+    @pytest.mark.parametrize(
+        "query,expected",
+        [
+            ("Apple Store", {"plan1"}),
+            ("Buy", {"plan2"}),
+            ("apple", {"plan1"}),
+            ("Nonexistent Store", set()),
+            ("A", {"plan1", "plan3"}),
+            ("", {"plan1", "plan2", "plan3"}),
+        ],
+        ids=["exact", "partial", "case_insensitive", "no_match", "multiple", "empty_query"],
+    )
+    def test_merchant_filter(self, sample_plans, query, expected):
+        """Test case-insensitive partial matching of merchant names."""
+        assert set(filter_plans_by_merchant(sample_plans, query)) == expected
+
+    def test_direct_rename_is_respected(self, sample_plans):
+        """Test a merchant name assigned directly is matched by its new value."""
+        filter_plans_by_merchant(sample_plans, "apple")
 
+        sample_plans["plan1"].merchant_name = "Target"
 
-@pytest.fixture
-def plans_with_status():
-    """Fixture providing plans with different payment statuses."""
+        assert set(filter_plans_by_merchant(sample_plans, "apple")) == set()
+        assert set(filter_plans_by_merchant(sample_plans, "target")) == {"plan1"}
+
+    def test_model_copy_rename_is_respected(self, sample_plans):
+        """Test a plan copied with an updated merchant name is matched by its new value."""
+        filter_plans_by_merchant(sample_plans, "apple")
+
+        sample_plans["plan1"] = sample_plans["plan1"].model_copy(update={"merchant_name": "Target"})
+
+        assert set(filter_plans_by_merchant(sample_plans, "target")) == {"plan1"}
+
+
+@pytest.fixture(scope="session")
+def _plans_with_status_template():
+    """Plans with different payment statuses, built once per session."""
     plans = {
-        "plan1": InstallmentPlan.build(
-            merchant_name="Store A",
-            total_amount=Decimal("300.00"),
-            purchase_date=date(2024, 1, 1),
+        "plan1": _build(
+            "Store A",
+            total_cents=30000,
             num_installments=3,
-            days_between=30,
-            first_payment_date=date(2024, 2, 1),
+            first_payment_date=_FEB_1,
         ),
-        "plan2": InstallmentPlan.build(
-            merchant_name="Store B",
-            total_amount=Decimal("400.00"),
-            purchase_date=date(2024, 1, 1),
+        "plan2": _build(
+            "Store B",
+            total_cents=40000,
             num_installments=2,
-            days_between=30,
-            first_payment_date=date(2024, 1, 5),
+            first_payment_date=_JAN_5,
+            statuses=[PaymentStatus.OVERDUE, PaymentStatus.OVERDUE],
         ),
-        "plan3": InstallmentPlan.build(
-            merchant_name="Store C",
-            total_amount=Decimal("500.00"),
-            purchase_date=date(2024, 1, 1),
+        "plan3": _build(
+            "Store C",
+            total_cents=50000,
             num_installments=2,
-            days_between=30,
-            first_payment_date=date(2024, 3, 1),
+            first_payment_date=_MAR_1,
         ),
     }
 
-    for inst in plans["plan1"].installments:
-        inst.mark_full_payment(date(2024, 2, 1))
-
-    for inst in plans["plan2"].installments:
-        inst.status = PaymentStatus.OVERDUE
+    plans["plan1"].mark_all_paid(_FEB_1)
 
     return plans
 
 
+@pytest.fixture
+def plans_with_status(_plans_with_status_template):
+    """Fixture providing a per-test copy of the plans with different payment statuses."""
+    return copy.deepcopy(_plans_with_status_template)
+
+
 @pytest.mark.unit
 class TestFilterPlansByStatus:
     """Tests for payment status filtering."""
 
-    def test_filter_fully_paid_true(self, plans_with_status):
-        """Test filtering for fully paid plans."""
-        result = filter_plans_by_status(plans_with_status, fully_paid=True)
-        assert len(result) == 1
-        assert "plan1" in result
-
-    def test_filter_fully_paid_false(self, plans_with_status):
-        """Test filtering for unpaid plans."""
-        result = filter_plans_by_status(plans_with_status, fully_paid=False)
-        assert len(result) == 2
-        assert "plan2" in result
-        assert "plan3" in result
-
-    def test_filter_has_overdue_true(self, plans_with_status):
-        """Test filtering for plans with overdue payments."""
-        result = filter_plans_by_status(plans_with_status, has_overdue=True)
-        assert len(result) == 2
-        assert "plan2" in result
-        assert "plan3" in result
-
-    def test_filter_has_overdue_false(self, plans_with_status):
-        """Test filtering for plans without overdue payments."""
-        result = filter_plans_by_status(plans_with_status, has_overdue=False)
-        assert len(result) == 1
-        assert "plan1" in result
-
-    def test_filter_combined(self, plans_with_status):
-        """Test combining fully_paid and has_overdue filters."""
-        result = filter_plans_by_status(plans_with_status, fully_paid=False, has_overdue=False)
-        assert len(result) == 0
-
-    def test_no_filters(self, plans_with_status):
-        """Test with no filters returns all plans."""
-        result = filter_plans_by_status(plans_with_status)
-        assert len(result) == 3
+    @pytest.mark.parametrize(
+        "filters,expected",
+        [
+            ({"fully_paid": True}, {"plan1"}),
+            ({"fully_paid": False}, {"plan2", "plan3"}),
+            ({"has_overdue": True}, {"plan2", "plan3"}),
+            ({"has_overdue": False}, {"plan1"}),
+            ({"fully_paid": False, "has_overdue": False}, set()),
+            ({}, {"plan1", "plan2", "plan3"}),
+        ],
+        ids=["fully_paid", "unpaid", "has_overdue", "no_overdue", "combined", "no_filters"],
+    )
+    def test_status_filter(self, plans_with_status, filters, expected):
+        """Test fully_paid and has_overdue filters alone and combined."""
+        assert set(filter_plans_by_status(plans_with_status, **filters)) == expected
 
 
-@pytest.fixture
-def plans_with_amounts():
-    """Fixture providing plans with different amounts."""
+@pytest.fixture(scope="session")
+def _plans_with_amounts_template():
+    """Plans with different amounts, built once per session."""
     plans = {
-        "plan1": InstallmentPlan.build(
-            merchant_name="Store A",
-            total_amount=Decimal("500.00"),
-            purchase_date=date(2024, 1, 1),
+        "plan1": _build(
+            "Store A",
+            total_cents=50000,
             num_installments=2,
-            days_between=30,
-            first_payment_date=date(2024, 2, 1),
+            first_payment_date=_FEB_1,
         ),
-        "plan2": InstallmentPlan.build(
-            merchant_name="Store B",
-            total_amount=Decimal("1000.00"),
-            purchase_date=date(2024, 1, 1),
+        "plan2": _build(
+            "Store B",
+            total_cents=100000,
             num_installments=4,
-            days_between=30,
-            first_payment_date=date(2024, 2, 1),
+            first_payment_date=_FEB_1,
         ),
-        "plan3": InstallmentPlan.build(
-            merchant_name="Store C",
-            total_amount=Decimal("1500.00"),
-            purchase_date=date(2024, 1, 1),
+        "plan3": _build(
+            "Store C",
+            total_cents=150000,
             num_installments=3,
-            days_between=30,
-            first_payment_date=date(2024, 2, 1),
+            first_payment_date=_FEB_1,
         ),
     }
 
-    plans["plan2"].installments[0].mark_full_payment(date(2024, 2, 1))
+    plans["plan2"].installments[0].mark_full_payment(_FEB_1)
 
     return plans
 
 
+@pytest.fixture
+def plans_with_amounts(_plans_with_amounts_template):
+    """Fixture providing a per-test copy of the plans with different amounts."""
+    return copy.deepcopy(_plans_with_amounts_template)
+
+
 @pytest.mark.unit
 class TestFilterPlansByAmount:
     """Tests for amount range filtering."""
@@ -208,49 +231,210 @@ class TestFilterPlansByAmount:
     def test_filter_min_total(self, plans_with_amounts):
         """Test filtering by minimum total amount."""
         result = filter_plans_by_amount(plans_with_amounts, min_total=Decimal("1000.00"))
-        assert len(result) == 2
-        assert "plan2" in result
-        assert "plan3" in result
+        assert set(result) == {"plan2", "plan3"}
 
     def test_filter_max_total(self, plans_with_amounts):
         """Test filtering by maximum total amount."""
         result = filter_plans_by_amount(plans_with_amounts, max_total=Decimal("1000.00"))
-        assert len(result) == 2
-        assert "plan1" in result
-        assert "plan2" in result
+        assert set(result) == {"plan1", "plan2"}
 
     def test_filter_total_range(self, plans_with_amounts):
         """Test filtering by total amount range."""
         result = filter_plans_by_amount(plans_with_amounts, min_total=Decimal("600.00"), max_total=Decimal("1200.00"))
-        assert len(result) == 1
-        assert "plan2" in result
+        assert set(result) == {"plan2"}
 
     @pytest.mark.parametrize(
-        "min_remaining,expected_plan",
+        "min_remaining,expected",
         [
-            (Decimal("1000.00"), "plan3"),
-            (Decimal("750.00"), "plan2"),
+            (Decimal("1000.00"), {"plan3"}),
+            (Decimal("750.00"), {"plan2", "plan3"}),
         ],
     )
-    def test_filter_min_remaining_parametrized(self, plans_with_amounts, min_remaining, expected_plan):
+    def test_filter_min_remaining_parametrized(self, plans_with_amounts, min_remaining, expected):
         """Test filtering by minimum remaining balance with different values."""
         result = filter_plans_by_amount(plans_with_amounts, min_remaining=min_remaining)
-        assert expected_plan in result
+        assert set(result) == expected
 
     def test_filter_remaining_range(self, plans_with_amounts):
         """Test filtering by remaining balance range."""
         result = filter_plans_by_amount(
             plans_with_amounts, min_remaining=Decimal("500.00"), max_remaining=Decimal("800.00")
         )
-        assert len(result) == 2
-        assert "plan1" in result
-        assert "plan2" in result
+        assert set(result) == {"plan1", "plan2"}
+
+    def test_no_bounds_returns_copy_of_all_plans(self, plans_with_amounts):
+        """Test no bounds returns every plan in a new dictionary."""
+        result = filter_plans_by_amount(plans_with_amounts)
+        assert result == plans_with_amounts
+        assert result is not plans_with_amounts
+
+    def test_filter_max_remaining(self, plans_with_amounts):
+        """Test filtering by maximum remaining balance."""
+        result = filter_plans_by_amount(plans_with_amounts, max_remaining=Decimal("750.00"))
+        assert set(result) == {"plan1", "plan2"}
+
+    def test_filter_combined(self, plans_with_amounts):
+        """Test combining total and remaining balance filters."""
+        result = filter_plans_by_amount(
+            plans_with_amounts, min_total=Decimal("1000.00"), max_remaining=Decimal("1000.00")
+        )
+        assert set(result) == {"plan2"}
 
 
-@pytest.mark.ui
-def test_search_filter_plans_integration(mocker):
-    """Example UI test showing how to test interactive functions with mocking."""
-    pass
+@pytest.fixture(scope="session")
+def _plans_with_dates_template():
+    """Plans with staggered purchase and payment dates, built once per session."""
+    return {
+        "plan1": _build(
+            "Store A",
+            total_cents=30000,
+            num_installments=3,
+            first_payment_date=_FEB_1,
+        ),
+        "plan2": _build(
+            "Store B",
+            total_cents=30000,
+            purchase_date=_FEB_1,
+            num_installments=3,
+            first_payment_date=_MAR_1,
+        ),
+        "plan3": _build(
+            "Store C",
+            total_cents=30000,
+            purchase_date=_MAR_1,
+            num_installments=3,
+            first_payment_date=_APR_1,
+        ),
+    }
+
+
+@pytest.fixture
+def plans_with_dates(_plans_with_dates_template):
+    """Fixture providing a per-test copy of the plans with staggered purchase and payment dates."""
+    return copy.deepcopy(_plans_with_dates_template)
+
+
+@pytest.mark.unit
+class TestFilterPlansByDate:
+    """Tests for purchase and next payment date filtering."""
+
+    @pytest.mark.parametrize(
+        "filters,expected",
+        [
+            ({"purchase_after": date(2024, 2, 1)}, {"plan2", "plan3"}),
+            ({"purchase_before": date(2024, 2, 1)}, {"plan1", "plan2"}),
+            ({"purchase_after": date(2024, 1, 15), "purchase_before": date(2024, 2, 15)}, {"plan2"}),
+            ({"next_payment_after": date(2024, 3, 1)}, {"plan2", "plan3"}),
+            ({"next_payment_before": date(2024, 3, 1)}, {"plan1", "plan2"}),
+            ({"next_payment_after": date(2024, 2, 15), "next_payment_before": date(2024, 3, 15)}, {"plan2"}),
+        ],
+        ids=[
+            "purchase_after",
+            "purchase_before",
+            "purchase_range",
+            "next_payment_after",
+            "next_payment_before",
+            "next_payment_range",
+        ],
+    )
+    def test_filter_by_date(self, _plans_with_dates_template, filters, expected):
+        """Test each purchase/next payment bound is inclusive and combines with the others."""
+        # Filtering is read-only, so every case can share the session template without a copy
+        result = filter_plans_by_date(_plans_with_dates_template, **filters)
+        assert set(result) == expected
+
+    def test_fully_paid_plan_excluded_by_next_payment_filter(self, plans_with_dates):
+        """Test plans without a next payment are excluded when filtering on next payment date."""
+        plans_with_dates["plan1"].mark_all_paid(date(2024, 2, 1))
+
+        result = filter_plans_by_date(plans_with_dates, next_payment_before=date(2024, 12, 31))
+        assert set(result) == {"plan2", "plan3"}
+
+    def test_fully_paid_plan_kept_by_purchase_filter(self, plans_with_dates):
+        """Test plans without a next payment still match when only purchase dates are filtered."""
+        plans_with_dates["plan1"].mark_all_paid(date(2024, 2, 1))
+
+        result = filter_plans_by_date(plans_with_dates, purchase_before=date(2024, 1, 31))
+        assert set(result) == {"plan1"}
+
+
+@pytest.mark.unit
+class TestCategorizeUnpaidInstallments:
+    """Tests for categorizing unpaid installments by due date."""
+
+    def test_overdue_days_precomputed(self, sample_plans):
+        """Test overdue_days is set for overdue payments and zero otherwise."""
+        categorized = categorize_unpaid_installments(sample_plans, date(2024, 2, 11), upcoming_days=30)
+
+        assert [p.overdue_days for p in categorized["overdue"]] == [10]
+        assert all(p.overdue_days == 0 for p in categorized["upcoming"] + categorized["future"])
+
+    def test_buckets_split_on_days_until_due(self, sample_plans):
+        """Test each unpaid installment lands in exactly one bucket by days until due."""
+        categorized = categorize_unpaid_installments(sample_plans, date(2024, 2, 15), upcoming_days=30)
+
+        assert [p.installment.due_date for p in categorized["overdue"]] == [date(2024, 2, 1)]
+        assert [p.installment.due_date for p in categorized["due_today"]] == [date(2024, 2, 15)]
+        assert [p.days_until_due for p in categorized["upcoming"]] == [15, 16, 30]
+        assert len(categorized["future"]) == 4
+        assert len(categorized["all_unpaid"]) == 9
+
+    def test_direct_due_date_assignment_is_respected(self, sample_plans):
+        """Test an installment whose due_date is assigned directly is bucketed by its new date."""
+        today = date(2024, 2, 11)
+        categorize_unpaid_installments(sample_plans, today, upcoming_days=30)
+
+        sample_plans["plan1"].installments[0].due_date = date(2024, 2, 20)
+        categorized = categorize_unpaid_installments(sample_plans, today, upcoming_days=30)
+
+        assert categorized["overdue"] == []
+        assert [p.days_until_due for p in categorized["upcoming"]][0] == 4
+
+    def test_model_copy_with_new_due_date_is_respected(self, sample_plans):
+        """Test an installment copied with an updated due_date is bucketed by its new date."""
+        today = date(2024, 2, 11)
+        plan = sample_plans["plan1"]
+        categorize_unpaid_installments(sample_plans, today, upcoming_days=30)
+
+        plan.installments[0] = plan.installments[0].model_copy(update={"due_date": date(2024, 1, 1)})
+        categorized = categorize_unpaid_installments(sample_plans, today, upcoming_days=30)
+
+        assert [p.overdue_days for p in categorized["overdue"]] == [41]
+
+    def test_update_overdue_marks_past_due_installments(self, sample_plans):
+        """Test update_overdue marks pending installments past their due date as OVERDUE."""
+        today = date(2024, 2, 11)
+        updated_before = {plan_id: plan.updated_at for plan_id, plan in sample_plans.items()}
+
+        categorized = categorize_unpaid_installments(sample_plans, today, upcoming_days=30, update_overdue=True)
+
+        assert [(p.plan_id, p.installment.installment_number) for p in categorized["overdue"]] == [("plan1", 1)]
+        assert sample_plans["plan1"].installments[0].status == PaymentStatus.OVERDUE
+        assert sample_plans["plan1"].installments[1].status == PaymentStatus.PENDING
+        assert sample_plans["plan1"].updated_at > updated_before["plan1"]
+        assert sample_plans["plan2"].updated_at == updated_before["plan2"]
+        assert sample_plans["plan3"].updated_at == updated_before["plan3"]
+
+    def test_categorize_without_update_leaves_status(self, sample_plans):
+        """Test categorization does not change statuses by default."""
+        categorize_unpaid_installments(sample_plans, date(2024, 2, 11), upcoming_days=30)
+
+        assert sample_plans["plan1"].installments[0].status == PaymentStatus.PENDING
+
+
+@pytest.mark.unit
+class TestCalculatePaymentStatistics:
+    """Tests for payment overview statistics."""
+
+    def test_paid_and_remaining_totals(self, plans_with_amounts):
+        """Test totals are split between paid and remaining installments."""
+        categorized = categorize_unpaid_installments(plans_with_amounts, date(2024, 1, 1), upcoming_days=30)
+        stats = calculate_payment_statistics(plans_with_amounts, categorized, [30])
+
+        assert stats["total_plans"] == 3
+        assert stats["fully_paid_count"] == 0
+        assert stats["total_paid"] == Decimal("250.00")
+        assert stats["total_remaining"] == Decimal("2750.00")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,54 @@
+"""
+Pytest tests for CSV writing utilities.
+"""
+
+import pytest
+
+from piggy.utils.csv_writer import write_csv_from_dicts
+
+
+@pytest.mark.unit
+class TestWriteCsvFromDicts:
+    """Tests for writing CSV content from dictionaries."""
+
+    def test_writes_rows_in_header_order(self):
+        """Test cells are written in header order regardless of dict order."""
+        result = write_csv_from_dicts(["a", "b"], [{"b": 2, "a": 1}])
+
+        assert result == "a,b\r\n1,2\r\n"
+
+    def test_missing_key_writes_empty_cell(self):
+        """Test a row missing a header key gets an empty cell."""
+        result = write_csv_from_dicts(["a", "b"], [{"a": 1}])
+
+        assert result == "a,b\r\n1,\r\n"
+
+    def test_extra_key_raises(self):
+        """Test a row with a key not in the headers is rejected."""
+        with pytest.raises(ValueError):
+            write_csv_from_dicts(["a"], [{"a": 1, "b": 2}])
+
+    def test_empty_headers(self):
+        """Test empty headers write empty lines instead of failing."""
+        result = write_csv_from_dicts([], [{}])
+
+        assert result == "\r\n\r\n"
+
+    def test_single_column(self):
+        """Test a single-column table writes one cell per row."""
+        result = write_csv_from_dicts(["a"], [{"a": 1}, {"a": 2}])
+
+        assert result == "a\r\n1\r\n2\r\n"
+
+    def test_writes_to_file(self, tmp_path):
+        """Test rows are written to the file and nothing is returned."""
+        file_path = tmp_path / "out.csv"
+
+        result = write_csv_from_dicts(["a"], [{"a": 1}], file_path)
+
+        assert result is None
+        assert file_path.read_text(encoding="utf-8") == "a\n1\n"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -10,168 +10,96 @@ from pydantic import ValidationError
 
 from piggy.installment_plan import Installment, InstallmentPlan, PaymentStatus
 
+# Expected due dates for the build schedule tests, one tuple per schedule
+_DATES_SINGLE = (date(2024, 2, 1),)
+_DATES_WEEKLY_4 = (date(2024, 1, 8), date(2024, 1, 15), date(2024, 1, 22), date(2024, 1, 29))
+_DATES_WEEKLY_5 = (*_DATES_WEEKLY_4, date(2024, 2, 5))
+_DATES_FORTNIGHTLY_3 = (date(2024, 1, 15), date(2024, 1, 29), date(2024, 2, 12))
+_DATES_FORTNIGHTLY_4 = (*_DATES_FORTNIGHTLY_3, date(2024, 2, 26))
+_DATES_CUSTOM_21_DAYS = (date(2024, 1, 22), date(2024, 2, 12), date(2024, 3, 4))
+_DATES_MONTHLY_4 = (date(2024, 2, 1), date(2024, 3, 2), date(2024, 4, 1), date(2024, 5, 1))
+_DATES_MONTHLY_10 = (
+    *_DATES_MONTHLY_4,
+    date(2024, 5, 31),
+    date(2024, 6, 30),
+    date(2024, 7, 30),
+    date(2024, 8, 29),
+    date(2024, 9, 28),
+    date(2024, 10, 28),
+)
+
+
+# Build arguments of the 4-installment sample plan
+_SAMPLE_PLAN_KWARGS = {
+    "merchant_name": "Test Store",
+    "total_amount": Decimal("1200.00"),
+    "purchase_date": date(2024, 1, 1),
+    "num_installments": 4,
+    "days_between": 30,
+    "first_payment_date": date(2024, 2, 1),
+}
+
+
+@pytest.fixture(scope="module")
+def sample_plan():
+    """Create a read-only sample plan with 4 installments, shared by the module's tests."""
+    return InstallmentPlan.build(**_SAMPLE_PLAN_KWARGS)
+
+
+@pytest.fixture
+def modifiable_plan(make_plan):
+    """Create a fresh sample plan for tests that mutate it."""
+    return make_plan(**_SAMPLE_PLAN_KWARGS)
+
 
 @pytest.mark.unit
 class TestBuildInstallmentPlan:
     """Tests for building installment plans with the build() factory method."""
 
-    def test_build_plan_with_equal_installments(self):
-        """Test building a plan with evenly divided installments."""
+    def test_build_plan_fields(self, sample_plan):
+        """Test the plan keeps the merchant, total and purchase date it was built with."""
+        assert sample_plan.merchant_name == "Test Store"
+        assert sample_plan.total_amount == Decimal("1200.00")
+        assert sample_plan.purchase_date == date(2024, 1, 1)
+
+    @pytest.mark.parametrize(
+        "total,days_between,expected_dates,expected_amount",
+        [
+            pytest.param(Decimal("1200.00"), 30, _DATES_MONTHLY_4, Decimal("300.00"), id="monthly"),
+            pytest.param(Decimal("600.00"), 14, _DATES_FORTNIGHTLY_3, Decimal("200.00"), id="fortnightly_3"),
+            pytest.param(Decimal("500.00"), 7, _DATES_WEEKLY_5, Decimal("100.00"), id="weekly_5"),
+            pytest.param(Decimal("250.00"), 30, _DATES_SINGLE, Decimal("250.00"), id="single"),
+            pytest.param(Decimal("280.00"), 7, _DATES_WEEKLY_4, Decimal("70.00"), id="weekly"),
+            pytest.param(Decimal("560.00"), 14, _DATES_FORTNIGHTLY_4, Decimal("140.00"), id="fortnightly"),
+            pytest.param(Decimal("450.00"), 21, _DATES_CUSTOM_21_DAYS, Decimal("150.00"), id="custom_21_days"),
+            pytest.param(Decimal("1000.00"), 30, _DATES_MONTHLY_10, Decimal("100.00"), id="ten_monthly"),
+        ],
+    )
+    def test_schedule(self, total, days_between, expected_dates, expected_amount):
+        """Test numbering, amounts, due dates and initial status of each built installment."""
         plan = InstallmentPlan.build(
             merchant_name="Test Store",
-            total_amount=Decimal("1200.00"),
+            total_amount=total,
             purchase_date=date(2024, 1, 1),
-            num_installments=4,
-            days_between=30,
-            first_payment_date=date(2024, 2, 1),
+            num_installments=len(expected_dates),
+            days_between=days_between,
+            first_payment_date=expected_dates[0],
         )
 
-        assert plan.merchant_name == "Test Store"
-        assert plan.total_amount == Decimal("1200.00")
-        assert plan.purchase_date == date(2024, 1, 1)
-        assert len(plan.installments) == 4
-
-        expected_amount = Decimal("300.00")
-        for inst in plan.installments:
+        for number, (inst, expected_date) in enumerate(zip(plan.installments, expected_dates, strict=True), start=1):
+            assert inst.installment_number == number
             assert inst.amount == expected_amount
-            assert inst.status == PaymentStatus.PENDING
-
-    def test_installment_dates_are_sequential(self):
-        """Test that installment due dates are correctly spaced."""
-        plan = InstallmentPlan.build(
-            merchant_name="Test Store",
-            total_amount=Decimal("600.00"),
-            purchase_date=date(2024, 1, 1),
-            num_installments=3,
-            days_between=14,
-            first_payment_date=date(2024, 1, 15),
-        )
-
-        expected_dates = [date(2024, 1, 15), date(2024, 1, 29), date(2024, 2, 12)]
-
-        for i, inst in enumerate(plan.installments):
-            assert inst.due_date == expected_dates[i]
-
-    def test_installment_numbers_are_sequential(self):
-        """Test that installment numbers start at 1 and increment."""
-        plan = InstallmentPlan.build(
-            merchant_name="Test Store",
-            total_amount=Decimal("500.00"),
-            purchase_date=date(2024, 1, 1),
-            num_installments=5,
-            days_between=7,
-            first_payment_date=date(2024, 1, 8),
-        )
-
-        for i, inst in enumerate(plan.installments, start=1):
-            assert inst.installment_number == i
-
-    def test_single_installment(self):
-        """Test building a plan with a single installment."""
-        plan = InstallmentPlan.build(
-            merchant_name="Test Store",
-            total_amount=Decimal("250.00"),
-            purchase_date=date(2024, 1, 1),
-            num_installments=1,
-            days_between=30,
-            first_payment_date=date(2024, 2, 1),
-        )
-
-        assert len(plan.installments) == 1
-        assert plan.installments[0].amount == Decimal("250.00")
-        assert plan.installments[0].due_date == date(2024, 2, 1)
-
-    def test_weekly_payment_schedule(self):
-        """Test weekly payment frequency."""
-        plan = InstallmentPlan.build(
-            merchant_name="Test Store",
-            total_amount=Decimal("280.00"),
-            purchase_date=date(2024, 1, 1),
-            num_installments=4,
-            days_between=7,
-            first_payment_date=date(2024, 1, 8),
-        )
-
-        expected_dates = [date(2024, 1, 8), date(2024, 1, 15), date(2024, 1, 22), date(2024, 1, 29)]
-
-        for i, inst in enumerate(plan.installments):
-            assert inst.due_date == expected_dates[i]
-
-    def test_fortnightly_payment_schedule(self):
-        """Test fortnightly payment frequency."""
-        plan = InstallmentPlan.build(
-            merchant_name="Test Store",
-            total_amount=Decimal("560.00"),
-            purchase_date=date(2024, 1, 1),
-            num_installments=4,
-            days_between=14,
-            first_payment_date=date(2024, 1, 15),
-        )
-
-        expected_amount = Decimal("140.00")
-        for inst in plan.installments:
-            assert inst.amount == expected_amount
-
-    def test_custom_payment_schedule(self):
-        """Test custom days between payments."""
-        plan = InstallmentPlan.build(
-            merchant_name="Test Store",
-            total_amount=Decimal("450.00"),
-            purchase_date=date(2024, 1, 1),
-            num_installments=3,
-            days_between=21,
-            first_payment_date=date(2024, 1, 22),
-        )
-
-        expected_dates = [date(2024, 1, 22), date(2024, 2, 12), date(2024, 3, 4)]
-
-        for i, inst in enumerate(plan.installments):
-            assert inst.due_date == expected_dates[i]
-
-    def test_all_installments_start_pending(self):
-        """Test that all installments start with PENDING status."""
-        plan = InstallmentPlan.build(
-            merchant_name="Test Store",
-            total_amount=Decimal("1000.00"),
-            purchase_date=date(2024, 1, 1),
-            num_installments=10,
-            days_between=30,
-            first_payment_date=date(2024, 2, 1),
-        )
-
-        for inst in plan.installments:
+            assert inst.due_date == expected_date
             assert inst.status == PaymentStatus.PENDING
             assert inst.paid_date is None
 
-    def test_computed_properties(self):
+    def test_computed_properties(self, sample_plan):
         """Test that computed properties work correctly."""
-        plan = InstallmentPlan.build(
-            merchant_name="Test Store",
-            total_amount=Decimal("600.00"),
-            purchase_date=date(2024, 1, 1),
-            num_installments=3,
-            days_between=30,
-            first_payment_date=date(2024, 2, 1),
-        )
-
-        assert plan.num_installments == 3
-        assert plan.remaining_balance == Decimal("600.00")
-        assert plan.is_fully_paid is False
-        assert plan.next_payment_due == date(2024, 2, 1)
-        assert len(plan.unpaid_installments) == 3
-
-
-@pytest.fixture
-def sample_plan():
-    """Create a sample plan with 4 installments for testing."""
-    return InstallmentPlan.build(
-        merchant_name="Test Store",
-        total_amount=Decimal("1200.00"),
-        purchase_date=date(2024, 1, 1),
-        num_installments=4,
-        days_between=30,
-        first_payment_date=date(2024, 2, 1),
-    )
+        assert sample_plan.num_installments == 4
+        assert sample_plan.remaining_balance == Decimal("1200.00")
+        assert sample_plan.is_fully_paid is False
+        assert sample_plan.next_payment_due == date(2024, 2, 1)
+        assert len(sample_plan.unpaid_installments) == 4
 
 
 @pytest.mark.unit
@@ -218,6 +146,11 @@ class TestGetInstallments:
         with pytest.raises(ValueError, match="Installment #99 does not exist"):
             sample_plan.get_installments([1, 2, 99])
 
+    def test_get_installments_zero_raises_error(self, sample_plan):
+        """Test that installment numbers below 1 are rejected."""
+        with pytest.raises(ValueError, match="Installment #0 does not exist"):
+            sample_plan.get_installments([2, 0])
+
     def test_get_installments_empty_list(self, sample_plan):
         """Test getting installments with empty list."""
         result = sample_plan.get_installments([])
@@ -225,6 +158,16 @@ class TestGetInstallments:
         assert result == []
 
 
+# Default fields for fresh_installment; each call validates a new Installment with its overrides applied
+_INSTALLMENT_DEFAULTS = {"installment_number": 1, "amount": Decimal("100.00"), "due_date": date(2024, 2, 1)}
+
+
+@pytest.fixture
+def fresh_installment():
+    """Factory creating a validated installment from the shared defaults, with optional field overrides."""
+    return lambda **updates: Installment(**(_INSTALLMENT_DEFAULTS | updates))
+
+
 @pytest.mark.unit
 class TestPartialPayments:
     """Test partial payment functionality."""
@@ -234,16 +177,14 @@ class TestPartialPayments:
         inst = Installment(installment_number=1, amount=Decimal("100.00"), due_date=date(2024, 2, 1))
         assert inst.amount_paid == Decimal("0")
 
-    def test_remaining_amount_calculation(self):
+    def test_remaining_amount_calculation(self, fresh_installment):
         """Test remaining_amount property calculates correctly."""
-        inst = Installment(
-            installment_number=1, amount=Decimal("100.00"), due_date=date(2024, 2, 1), amount_paid=Decimal("30.00")
-        )
+        inst = fresh_installment(amount_paid=Decimal("30.00"))
         assert inst.remaining_amount == Decimal("70.00")
 
-    def test_is_partially_paid_property(self):
+    def test_is_partially_paid_property(self, fresh_installment):
         """Test is_partially_paid property returns correct values."""
-        inst = Installment(installment_number=1, amount=Decimal("100.00"), due_date=date(2024, 2, 1))
+        inst = fresh_installment()
 
         # Not paid at all
         assert inst.is_partially_paid is False
@@ -256,9 +197,9 @@ class TestPartialPayments:
         inst.amount_paid = Decimal("100.00")
         assert inst.is_partially_paid is False
 
-    def test_mark_partial_payment_success(self):
+    def test_mark_partial_payment_success(self, fresh_installment):
         """Test marking a partial payment works correctly."""
-        inst = Installment(installment_number=1, amount=Decimal("100.00"), due_date=date(2024, 2, 1))
+        inst = fresh_installment()
 
         inst.mark_partial_payment(Decimal("30.00"), date(2024, 2, 5))
 
@@ -268,9 +209,9 @@ class TestPartialPayments:
         assert inst.status == PaymentStatus.PENDING
         assert inst.paid_date is None
 
-    def test_mark_partial_payment_multiple_times(self):
+    def test_mark_partial_payment_multiple_times(self, fresh_installment):
         """Test multiple partial payments accumulate correctly."""
-        inst = Installment(installment_number=1, amount=Decimal("100.00"), due_date=date(2024, 2, 1))
+        inst = fresh_installment()
 
         inst.mark_partial_payment(Decimal("30.00"), date(2024, 2, 5))
         inst.mark_partial_payment(Decimal("20.00"), date(2024, 2, 10))
@@ -279,9 +220,9 @@ class TestPartialPayments:
         assert inst.remaining_amount == Decimal("50.00")
         assert inst.is_partially_paid is True
 
-    def test_mark_partial_payment_completes_to_paid(self):
+    def test_mark_partial_payment_completes_to_paid(self, fresh_installment):
         """Test partial payment that completes the full amount marks as PAID."""
-        inst = Installment(installment_number=1, amount=Decimal("100.00"), due_date=date(2024, 2, 1))
+        inst = fresh_installment()
 
         inst.mark_partial_payment(Decimal("60.00"), date(2024, 2, 5))
         inst.mark_partial_payment(Decimal("40.00"), date(2024, 2, 10))
@@ -292,11 +233,9 @@ class TestPartialPayments:
         assert inst.status == PaymentStatus.PAID
         assert inst.paid_date == date(2024, 2, 10)
 
-    def test_mark_partial_payment_exceeds_amount_raises_error(self):
+    def test_mark_partial_payment_exceeds_amount_raises_error(self, fresh_installment):
         """Test that partial payment exceeding remaining amount raises ValueError."""
-        inst = Installment(
-            installment_number=1, amount=Decimal("100.00"), due_date=date(2024, 2, 1), amount_paid=Decimal("60.00")
-        )
+        inst = fresh_installment(amount_paid=Decimal("60.00"))
 
         with pytest.raises(ValueError, match="exceed remaining balance"):
             inst.mark_partial_payment(Decimal("50.00"), date(2024, 2, 5))
@@ -308,11 +247,9 @@ class TestPartialPayments:
                 installment_number=1, amount=Decimal("100.00"), due_date=date(2024, 2, 1), amount_paid=Decimal("150.00")
             )
 
-    def test_mark_paid_sets_amount_paid(self):
+    def test_mark_paid_sets_amount_paid(self, fresh_installment):
         """Test mark_paid sets amount_paid to full amount."""
-        inst = Installment(
-            installment_number=1, amount=Decimal("100.00"), due_date=date(2024, 2, 1), amount_paid=Decimal("30.00")
-        )
+        inst = fresh_installment(amount_paid=Decimal("30.00"))
 
         inst.mark_full_payment(date(2024, 2, 5))
 
@@ -321,12 +258,9 @@ class TestPartialPayments:
         assert inst.status == PaymentStatus.PAID
         assert inst.paid_date == date(2024, 2, 5)
 
-    def test_mark_unpaid_resets_amount_paid(self):
+    def test_mark_unpaid_resets_amount_paid(self, fresh_installment):
         """Test mark_unpaid resets amount_paid to zero."""
-        inst = Installment(
-            installment_number=1,
-            amount=Decimal("100.00"),
-            due_date=date(2024, 2, 1),
+        inst = fresh_installment(
             status=PaymentStatus.PAID,
             paid_date=date(2024, 2, 5),
             amount_paid=Decimal("100.00"),
@@ -339,30 +273,25 @@ class TestPartialPayments:
         assert inst.status == PaymentStatus.PENDING
         assert inst.paid_date is None
 
-    def test_remaining_balance_with_partial_payments(self):
+    def test_remaining_balance_with_partial_payments(self, fresh_installment):
         """Test InstallmentPlan.remaining_balance accounts for partial payments."""
         plan = InstallmentPlan(
             merchant_name="Test Store",
             total_amount=Decimal("300.00"),
             purchase_date=date(2024, 1, 1),
             installments=[
-                Installment(
-                    installment_number=1,
-                    amount=Decimal("100.00"),
-                    due_date=date(2024, 2, 1),
+                fresh_installment(
                     amount_paid=Decimal("50.00"),  # Partially paid
                 ),
-                Installment(
+                fresh_installment(
                     installment_number=2,
-                    amount=Decimal("100.00"),
                     due_date=date(2024, 3, 1),
                     status=PaymentStatus.PAID,
                     paid_date=date(2024, 3, 1),
                     amount_paid=Decimal("100.00"),  # Fully paid
                 ),
-                Installment(
+                fresh_installment(
                     installment_number=3,
-                    amount=Decimal("100.00"),
                     due_date=date(2024, 4, 1),
                     # Not paid - amount_paid defaults to 0
                 ),
@@ -377,5 +306,22 @@ class TestPartialPayments:
         assert plan.remaining_balance == Decimal("150.00")
 
 
+@pytest.mark.unit
+class TestMarkAllPaid:
+    """Test marking a whole plan as paid."""
+
+    def test_mark_all_paid(self, modifiable_plan):
+        """Test every installment is paid in full on the given date."""
+        modifiable_plan.installments[0].mark_partial_payment(Decimal("100.00"), date(2024, 1, 15))
+
+        modifiable_plan.mark_all_paid(date(2024, 2, 1))
+
+        assert modifiable_plan.is_fully_paid
+        assert modifiable_plan.remaining_balance == Decimal("0")
+        for inst in modifiable_plan.installments:
+            assert inst.paid_date == date(2024, 2, 1)
+            assert inst.amount_paid == inst.amount
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -8,14 +8,14 @@ from piggy.interactive import (
     get_installment_status_symbol,
     get_plan_status_icon,
 )
-from piggy.menu import CommandResult, NavigationContext
+from piggy.menu import CommandResult
 from piggy.plan_manager import PlanManager
 
 
 @pytest.fixture
-def sample_plan():
+def sample_plan(make_plan):
     """Create a sample installment plan for testing."""
-    return InstallmentPlan.build(
+    return make_plan(
         merchant_name="Test Store",
         total_amount=Decimal("1200.00"),
         purchase_date=date(2024, 1, 1),
@@ -35,11 +35,9 @@ def plan_manager(tmp_path):
 @pytest.fixture
 def nav_context(plan_manager):
     """Create a navigation context with plan manager."""
-    from piggy.interactive import ContextKeys
+    from piggy.interactive import AppContext
 
-    context = NavigationContext()
-    context.set_data(ContextKeys.PLAN_MANAGER, plan_manager)
-    return context
+    return AppContext(plan_manager)
 
 
 @pytest.mark.unit
@@ -71,8 +69,7 @@ class TestStatusIcons:
 
     def test_get_plan_status_icon_fully_paid(self, sample_plan):
         """Test status icon for fully paid plan."""
-        for inst in sample_plan.installments:
-            inst.mark_full_payment(date(2024, 2, 1))
+        sample_plan.mark_all_paid(date(2024, 2, 1))
 
         icon = get_plan_status_icon(sample_plan)
         assert icon == "✓"
@@ -82,6 +79,13 @@ class TestStatusIcons:
         icon = get_plan_status_icon(sample_plan)
         assert icon == "○"
 
+    def test_get_installment_status_symbol_overdue(self, sample_plan):
+        """Test overdue installments without payments use the unpaid symbol."""
+        inst = sample_plan.installments[0]
+        inst.set_status(PaymentStatus.OVERDUE)
+
+        assert get_installment_status_symbol(inst) == "○"
+
     @pytest.mark.parametrize(
         "amount_paid,expected_symbol",
         [
@@ -103,15 +107,93 @@ class TestStatusIcons:
         assert symbol == expected_symbol
 
 
+@pytest.mark.unit
+class TestParseInstallmentNumbers:
+    """Tests for parsing comma-separated installment numbers."""
+
+    @pytest.mark.parametrize(
+        "input_str,expected",
+        [
+            ("1", [1]),
+            ("1,2,3", [1, 2, 3]),
+            (" 3 , 1 ", [3, 1]),
+            ("1,1,2", [1, 2]),
+        ],
+    )
+    def test_parse_valid_input(self, input_str, expected):
+        """Test valid input is parsed into unique numbers in order."""
+        from piggy.interactive import _parse_installment_numbers
+
+        assert _parse_installment_numbers(input_str) == expected
+
+    @pytest.mark.parametrize("input_str", ["a", "1,,2", "1 2"])
+    def test_parse_invalid_input_raises_error(self, input_str):
+        """Test invalid input raises ValueError."""
+        from piggy.interactive import _parse_installment_numbers
+
+        with pytest.raises(ValueError):
+            _parse_installment_numbers(input_str)
+
+
+@pytest.mark.unit
+class TestRenderPlanChoices:
+    """Tests for the numbered plan list used by plan pickers."""
+
+    def test_render_plan_choices(self, sample_plan):
+        """Test plans are numbered from 1 in the given plan ID order."""
+        from piggy.interactive import _render_plan_choices
+
+        rendered = _render_plan_choices(("plan_b", "plan_a"), {"plan_a": sample_plan, "plan_b": sample_plan})
+
+        assert rendered.splitlines() == [
+            "1. plan_b - $1200.00 (Test Store)",
+            "2. plan_a - $1200.00 (Test Store)",
+        ]
+
+    def test_select_plan_returns_the_plan_shown_at_the_chosen_number(self, mocker, capsys, nav_context, sample_plan):
+        """Test the chosen number selects the plan listed under it, using the manager's plan ID order."""
+        from piggy.interactive import select_plan
+
+        other_plan = sample_plan.model_copy(update={"merchant_name": "Other Store"})
+        nav_context.plan_manager.add_plan("plan_a", sample_plan)
+        nav_context.plan_manager.add_plan("plan_b", other_plan)
+        mocker.patch.object(nav_context.plan_manager, "list_plan_ids", return_value=("plan_b", "plan_a"))
+        mocker.patch("piggy.interactive.get_int_input", return_value=1)
+
+        result = select_plan(nav_context)
+
+        assert "1. plan_b - $1200.00 (Other Store)" in capsys.readouterr().out
+        assert result == ("plan_b", other_plan)
+
+
+@pytest.mark.ui
+class TestDisplayInstallmentsUI:
+    """Tests for the installment list shown before recording payments."""
+
+    def test_display_paid_and_partial_suffixes(self, capsys, sample_plan):
+        """Test paid installments show their paid date and partial ones their paid/remaining amounts."""
+        from piggy.interactive import _display_installments
+
+        sample_plan.mark_installment_paid(1, date(2024, 2, 1))
+        sample_plan.installments[1].mark_partial_payment(Decimal("100.00"), date(2024, 3, 1))
+
+        _display_installments(sample_plan)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[2].endswith("due 2024-02-01 [PAID on 2024-02-01]")
+        assert lines[3].endswith("due 2024-03-02 [Paid: $100.00, Remaining: $200.00]")
+        assert lines[4].endswith("due 2024-04-01")
+
+
 @pytest.mark.ui
 class TestMarkPaymentUI:
     """Tests for mark_payment interactive function."""
 
     def test_mark_payment_full_amount(self, mocker, nav_context, sample_plan):
         """Test marking payment with full amount."""
-        from piggy.interactive import ContextKeys, mark_payment
+        from piggy.interactive import mark_payment
 
-        nav_context.get_data(ContextKeys.PLAN_MANAGER).add_plan("test_plan", sample_plan)
+        nav_context.plan_manager.add_plan("test_plan", sample_plan)
 
         mocker.patch("piggy.interactive.print_heading")
         mocker.patch("piggy.interactive.select_plan", return_value=("test_plan", sample_plan))
@@ -128,9 +210,9 @@ class TestMarkPaymentUI:
 
     def test_mark_payment_partial_amount(self, mocker, nav_context, sample_plan):
         """Test marking payment with partial amount."""
-        from piggy.interactive import ContextKeys, mark_payment
+        from piggy.interactive import mark_payment
 
-        nav_context.get_data(ContextKeys.PLAN_MANAGER).add_plan("test_plan", sample_plan)
+        nav_context.plan_manager.add_plan("test_plan", sample_plan)
 
         mocker.patch("piggy.interactive.print_heading")
         mocker.patch("piggy.interactive.select_plan", return_value=("test_plan", sample_plan))
@@ -157,11 +239,11 @@ class TestMarkPaymentUI:
 
     def test_mark_payment_already_paid(self, mocker, nav_context, sample_plan):
         """Test marking payment on already paid installment."""
-        from piggy.interactive import ContextKeys, mark_payment
+        from piggy.interactive import mark_payment
 
         # Mark installment as paid
         sample_plan.installments[0].mark_full_payment(date(2024, 1, 15))
-        nav_context.get_data(ContextKeys.PLAN_MANAGER).add_plan("test_plan", sample_plan)
+        nav_context.plan_manager.add_plan("test_plan", sample_plan)
 
         mocker.patch("piggy.interactive.print_heading")
         mocker.patch("piggy.interactive.select_plan", return_value=("test_plan", sample_plan))
@@ -173,15 +255,131 @@ class TestMarkPaymentUI:
         assert "already fully paid" in result.message.lower()
 
 
+@pytest.mark.ui
+class TestSelectPaidInstallmentUI:
+    """Tests for _select_paid_installment interactive function."""
+
+    def test_select_paid_installment(self, mocker, sample_plan):
+        """Test selecting a paid installment returns it."""
+        from piggy.interactive import _select_paid_installment
+
+        sample_plan.installments[1].mark_full_payment(date(2024, 3, 1))
+
+        mocker.patch("piggy.interactive.print")
+        mocker.patch("piggy.interactive.get_int_input", return_value=2)
+
+        assert _select_paid_installment(sample_plan) is sample_plan.installments[1]
+
+    def test_select_unpaid_installment_rejected(self, mocker, sample_plan):
+        """Test selecting an unpaid installment returns None."""
+        from piggy.interactive import _select_paid_installment
+
+        sample_plan.installments[1].mark_full_payment(date(2024, 3, 1))
+
+        mocker.patch("piggy.interactive.print")
+        mocker.patch("piggy.interactive.get_int_input", return_value=1)
+
+        assert _select_paid_installment(sample_plan) is None
+
+    def test_no_paid_installments_skips_prompt(self, mocker, sample_plan):
+        """Test plans without paid installments return None without prompting."""
+        from piggy.interactive import _select_paid_installment
+
+        mocker.patch("piggy.interactive.print")
+        mock_input = mocker.patch("piggy.interactive.get_int_input")
+
+        assert _select_paid_installment(sample_plan) is None
+        mock_input.assert_not_called()
+
+
+@pytest.mark.ui
+class TestListInstallmentPlansUI:
+    """Tests for list_installment_plans interactive function."""
+
+    def test_list_shows_remaining_summary(self, mocker, capsys, nav_context, sample_plan):
+        """Test plan summary reports remaining balance, installment count and status."""
+        from piggy.interactive import list_installment_plans
+
+        sample_plan.installments[0].mark_full_payment(date(2024, 2, 1))
+        sample_plan.installments[1].mark_partial_payment(Decimal("100.00"), date(2024, 3, 1))
+        nav_context.plan_manager.add_plan("test_plan", sample_plan)
+
+        mocker.patch("piggy.interactive.print_heading")
+
+        list_installment_plans(nav_context)
+        output = capsys.readouterr().out
+
+        assert "Remaining: $800.00" in output
+        assert "Installments: 3/4 remaining" in output
+        assert "Status: Active" in output
+
+    def test_list_fully_paid_plan(self, mocker, capsys, nav_context, sample_plan):
+        """Test fully paid plan is reported with no remaining installments."""
+        from piggy.interactive import list_installment_plans
+
+        sample_plan.mark_all_paid(date(2024, 2, 1))
+        nav_context.plan_manager.add_plan("test_plan", sample_plan)
+
+        mocker.patch("piggy.interactive.print_heading")
+
+        list_installment_plans(nav_context)
+        output = capsys.readouterr().out
+
+        assert "Installments: 0/4 remaining" in output
+        assert "Status: Fully Paid" in output
+
+
+@pytest.mark.ui
+class TestOverviewUI:
+    """Tests for overview interactive function."""
+
+    def test_overview_writes_all_sections_at_once(self, mocker, nav_context, sample_plan):
+        """Test overview output is emitted in one print call with every section."""
+        from piggy.interactive import overview
+
+        nav_context.plan_manager.add_plan("test_plan", sample_plan)
+
+        mocker.patch("piggy.interactive.print_heading")
+        mocker.patch("piggy.interactive.date").today.return_value = date(2024, 3, 2)
+        mock_print = mocker.patch("piggy.interactive.print")
+
+        overview(nav_context)
+
+        mock_print.assert_called_once()
+        output = mock_print.call_args.args[0]
+        assert "Total Plans: 1 (0 fully paid, 1 active)" in output
+        assert "OVERDUE PAYMENTS (1)" in output
+        assert "DUE TODAY (1)" in output
+        assert "UPCOMING (Next 30 Days)" in output
+
+    def test_overview_all_paid_skips_categorization(self, mocker, nav_context, sample_plan):
+        """Test overview skips gathering unpaid installments when every plan is fully paid."""
+        from piggy.interactive import overview
+
+        sample_plan.mark_all_paid(date(2024, 2, 1))
+        nav_context.plan_manager.add_plan("test_plan", sample_plan)
+
+        mocker.patch("piggy.interactive.print_heading")
+        categorize = mocker.patch("piggy.interactive.categorize_unpaid_installments")
+        mock_print = mocker.patch("piggy.interactive.print")
+
+        overview(nav_context)
+
+        categorize.assert_not_called()
+        output = mock_print.call_args.args[0]
+        assert "Total Plans: 1 (1 fully paid, 0 active)" in output
+        assert "Total Paid: $1200.00" in output
+
+
 @pytest.mark.ui
 class TestSearchFilterPlansUI:
     """Tests for search_filter_plans interactive function."""
 
     def test_search_by_merchant(self, mocker, nav_context):
         """Test filtering plans by merchant name."""
-        from piggy.interactive import ContextKeys, search_filter_plans
+        from piggy.interactive import search_filter_plans
 
-        plan_manager = nav_context.get_data(ContextKeys.PLAN_MANAGER)
+        plan_manager = nav_context.plan_manager
         plan1 = InstallmentPlan.build(
             merchant_name="Apple Store",
             total_amount=Decimal("1200.00"),
@@ -211,9 +409,9 @@ class TestSearchFilterPlansUI:
 
     def test_filter_no_results(self, mocker, nav_context):
         """Test filtering with no matching results."""
-        from piggy.interactive import ContextKeys, search_filter_plans
+        from piggy.interactive import search_filter_plans
 
-        plan_manager = nav_context.get_data(ContextKeys.PLAN_MANAGER)
+        plan_manager = nav_context.plan_manager
         plan1 = InstallmentPlan.build(
             merchant_name="Apple Store",
             total_amount=Decimal("1200.00"),
@@ -234,9 +432,9 @@ class TestSearchFilterPlansUI:
 
     def test_show_all_plans(self, mocker, nav_context):
         """Test showing all plans without filtering."""
-        from piggy.interactive import ContextKeys, search_filter_plans
+        from piggy.interactive import search_filter_plans
 
-        plan_manager = nav_context.get_data(ContextKeys.PLAN_MANAGER)
+        plan_manager = nav_context.plan_manager
         plan1 = InstallmentPlan.build(
             merchant_name="Store 1",
             total_amount=Decimal("1000.00"),
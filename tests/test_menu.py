@@ -0,0 +1,266 @@
+"""
+Pytest tests for the menu navigation framework.
+"""
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from piggy.menu import (
+    _BACK_RESULT,
+    _EXIT_RESULT,
+    BACK_COMMAND,
+    EXIT_COMMAND,
+    BackCommand,
+    Command,
+    CommandResult,
+    ExitCommand,
+    Menu,
+    MenuInterface,
+    NavigationAction,
+    NavigationContext,
+)
+
+
+def _noop() -> CommandResult:
+    return CommandResult()
+
+
+@pytest.fixture
+def context():
+    """Create a navigation context with Main > Plans > Edit on the stack."""
+    context = NavigationContext()
+    for title in ("Main", "Plans", "Edit"):
+        context.push_menu(Menu(title))
+    return context
+
+
+@pytest.mark.unit
+class TestNavigationContextBreadcrumb:
+    """Tests for keeping the breadcrumb in sync with the menu stack."""
+
+    def test_empty_context(self):
+        """Test a new context has an empty breadcrumb."""
+        assert NavigationContext().get_breadcrumb() == ""
+
+    def test_push(self, context):
+        """Test pushing menus appends their titles."""
+        assert context.get_breadcrumb() == "Main > Plans > Edit"
+
+    def test_pop(self, context):
+        """Test popping a menu drops its title."""
+        context.pop_menu()
+        assert context.get_breadcrumb() == "Main > Plans"
+
+    def test_pop_at_root(self):
+        """Test popping at the root keeps the root menu."""
+        context = NavigationContext()
+        context.push_menu(Menu("Main"))
+
+        assert context.pop_menu() is None
+        assert context.get_breadcrumb() == "Main"
+
+    def test_pop_to_root(self, context):
+        """Test popping to root leaves only the root title."""
+        context.pop_menu_to_root()
+        assert context.get_breadcrumb() == "Main"
+
+    def test_pop_to_root_at_root(self):
+        """Test popping to root when already at the root keeps the root title."""
+        context = NavigationContext()
+        context.push_menu(Menu("Main"))
+
+        context.pop_menu_to_root()
+
+        assert context.get_breadcrumb() == "Main"
+
+    def test_replace(self, context):
+        """Test replacing the current menu swaps the last title."""
+        context.replace_menu(Menu("Details"))
+        assert context.get_breadcrumb() == "Main > Plans > Details"
+
+    def test_replace_at_root(self):
+        """Test replacing the root menu swaps the only title."""
+        context = NavigationContext()
+        context.push_menu(Menu("Main"))
+
+        context.replace_menu(Menu("Home"))
+
+        assert context.get_breadcrumb() == "Home"
+
+    def test_replace_on_empty_stack(self):
+        """Test replacing on an empty stack pushes the menu."""
+        context = NavigationContext()
+
+        context.replace_menu(Menu("Main"))
+
+        assert context.get_breadcrumb() == "Main"
+
+
+@pytest.mark.unit
+class TestMenuDisplay:
+    """Tests for menu command ordering and the cached display text."""
+
+    @pytest.mark.parametrize(
+        "sort_commands,expected_keys",
+        [(True, ["a", "b", "c"]), (False, ["c", "a", "b"])],
+        ids=["sorted", "insertion_order"],
+    )
+    def test_display_order(self, capsys, sort_commands, expected_keys):
+        """Test commands display sorted by key or in insertion order."""
+        menu = Menu("Main", sort_commands=sort_commands)
+        for key in ("c", "a", "b"):
+            menu.add_command(key, Command(f"Option {key}", _noop))
+
+        menu.display()
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines == ["Main", *(f"{key}. Option {key}" for key in expected_keys)]
+
+    def test_display_refreshes_after_add_command(self, capsys):
+        """Test a command added after the menu was displayed shows up on the next display."""
+        menu = Menu("Main", sort_commands=True)
+        menu.add_command("b", Command("Second", _noop))
+        menu.display()
+        capsys.readouterr()
+
+        menu.add_command("a", Command("First", _noop))
+        menu.display()
+
+        assert capsys.readouterr().out.splitlines() == ["Main", "a. First", "b. Second"]
+
+    def test_duplicate_key_raises(self):
+        """Test adding a command under an existing key is rejected."""
+        menu = Menu("Main")
+        menu.add_command("a", Command("First", _noop))
+
+        with pytest.raises(KeyError):
+            menu.add_command("a", Command("Again", _noop))
+
+
+@pytest.mark.unit
+class TestMenuInterfaceRun:
+    """Tests for the navigation actions dispatched by the menu loop."""
+
+    def test_exit_ends_loop(self, mocker):
+        """Test EXIT stops the loop and returns the last return value."""
+        main = Menu("Main")
+        main.add_command("v", Command("Value", lambda: CommandResult(return_value=42)))
+        main.add_command("x", EXIT_COMMAND)
+        mocker.patch("builtins.input", side_effect=["v", "x"])
+
+        assert MenuInterface(main).run() == 42
+
+    def test_pop_at_root_ends_loop(self, mocker):
+        """Test POP with only the root menu on the stack stops the loop."""
+        main = Menu("Main")
+        main.add_back_command()
+        context = NavigationContext()
+        mock_input = mocker.patch("builtins.input", side_effect=["b"])
+
+        MenuInterface(main, context).run()
+
+        assert mock_input.call_count == 1
+        assert context.get_breadcrumb() == "Main"
+
+    def test_push_and_pop(self, mocker):
+        """Test PUSH opens a submenu and POP returns to its parent without ending the loop."""
+        main, sub = Menu("Main"), Menu("Sub")
+        main.add_submenu("s", sub)
+        main.add_command("x", EXIT_COMMAND)
+        sub.add_back_command()
+        sub.add_command("x", EXIT_COMMAND)
+        context = NavigationContext()
+        mocker.patch("builtins.input", side_effect=["s", "b", "s", "x"])
+
+        MenuInterface(main, context).run()
+
+        assert context.get_current_menu() is sub
+        assert context.get_breadcrumb() == "Main > Sub"
+
+    def test_replace(self, mocker):
+        """Test REPLACE swaps the current menu for the target menu."""
+        main, other = Menu("Main"), Menu("Other")
+        main.add_command("r", Command("Replace", lambda: CommandResult(NavigationAction.REPLACE, target_menu=other)))
+        other.add_command("x", EXIT_COMMAND)
+        context = NavigationContext()
+        mocker.patch("builtins.input", side_effect=["r", "x"])
+
+        MenuInterface(main, context).run()
+
+        assert context.get_current_menu() is other
+        assert context.get_breadcrumb() == "Other"
+
+    def test_pop_to_root(self, mocker):
+        """Test POP_TO_ROOT returns to the root menu without ending the loop."""
+        main, sub, deeper = Menu("Main"), Menu("Sub"), Menu("Deeper")
+        main.add_submenu("s", sub)
+        main.add_command("x", EXIT_COMMAND)
+        sub.add_submenu("d", deeper)
+        deeper.add_command("h", Command("Home", lambda: CommandResult(NavigationAction.POP_TO_ROOT)))
+        context = NavigationContext()
+        mocker.patch("builtins.input", side_effect=["s", "d", "h", "x"])
+
+        MenuInterface(main, context).run()
+
+        assert context.get_current_menu() is main
+        assert context.get_breadcrumb() == "Main"
+
+    def test_none_keeps_current_menu(self, mocker):
+        """Test an unknown choice keeps the current menu and the loop running."""
+        main = Menu("Main")
+        main.add_command("x", EXIT_COMMAND)
+        mock_input = mocker.patch("builtins.input", side_effect=["?", "x"])
+
+        MenuInterface(main).run()
+
+        assert mock_input.call_count == 2
+
+
+@pytest.mark.unit
+class TestSharedCommandResults:
+    """Tests for the shared Back/Exit command singletons and their frozen results."""
+
+    @pytest.mark.parametrize(
+        "command,expected_result,expected_action",
+        [
+            (BACK_COMMAND, _BACK_RESULT, NavigationAction.POP),
+            (EXIT_COMMAND, _EXIT_RESULT, NavigationAction.EXIT),
+        ],
+        ids=["back", "exit"],
+    )
+    def test_singletons_return_shared_result(self, command, expected_result, expected_action):
+        """Test each singleton returns the same shared result on every call."""
+        context = NavigationContext()
+
+        assert command.execute(context) is expected_result
+        assert command.execute(context) is expected_result
+        assert expected_result.action == expected_action
+
+    def test_new_instances_return_shared_result(self):
+        """Test separately created commands still return the shared results."""
+        context = NavigationContext()
+
+        assert BackCommand().execute(context) is _BACK_RESULT
+        assert ExitCommand().execute(context) is _EXIT_RESULT
+
+    @pytest.mark.parametrize("result", [_BACK_RESULT, _EXIT_RESULT], ids=["back", "exit"])
+    def test_shared_results_are_frozen(self, result):
+        """Test the shared results cannot be modified."""
+        with pytest.raises(FrozenInstanceError):
+            result.action = NavigationAction.NONE
+        with pytest.raises(FrozenInstanceError):
+            result.message = "changed"
+
+        assert result.message is None
+
+    def test_add_back_command_uses_singleton(self):
+        """Test add_back_command registers the shared Back command."""
+        menu = Menu("Main")
+        menu.add_back_command()
+
+        assert menu.handle_input("b", NavigationContext()) is _BACK_RESULT
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
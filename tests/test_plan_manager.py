@@ -8,14 +8,15 @@ from pathlib import Path
 
 import pytest
 
-from piggy.installment_plan import InstallmentPlan
+from piggy.analytics import categorize_unpaid_installments
+from piggy.installment_plan import PaymentStatus
 from piggy.plan_manager import PlanManager
 
 
 @pytest.fixture
-def sample_plan():
+def sample_plan(make_plan):
     """Create a sample installment plan for testing."""
-    return InstallmentPlan.build(
+    return make_plan(
         merchant_name="Test Store",
         total_amount=Decimal("1200.00"),
         purchase_date=date(2024, 1, 1),
@@ -80,6 +81,29 @@ class TestPlanManager:
         assert "plan1" in plans
         assert "plan2" in plans
 
+    def test_list_plan_ids_follows_insertion_order(self, plan_manager, sample_plan):
+        """Test plan IDs are listed in insertion order."""
+        plan_manager.add_plan("plan2", sample_plan)
+        plan_manager.add_plan("plan1", sample_plan)
+        assert plan_manager.list_plan_ids() == ("plan2", "plan1")
+
+    def test_list_plan_ids_updates_after_changes(self, plan_manager, sample_plan):
+        """Test cached plan IDs are refreshed after adding and removing plans."""
+        plan_manager.add_plan("plan1", sample_plan)
+        assert plan_manager.list_plan_ids() == ("plan1",)
+
+        plan_manager.add_plan("plan2", sample_plan)
+        plan_manager.remove_plan("plan1")
+        assert plan_manager.list_plan_ids() == ("plan2",)
+
+    def test_get_plan_file_path(self, plan_manager, tmp_path):
+        """Test plan file paths are built from the storage directory and reused."""
+        json_path = plan_manager.get_plan_file_path("plan1", "json")
+
+        assert json_path == tmp_path / "plan1.json"
+        assert plan_manager.get_plan_file_path("plan1", "json") is json_path
+        assert plan_manager.get_plan_file_path("plan1", "csv") == tmp_path / "plan1.csv"
+
     def test_has_plans_empty(self, plan_manager):
         """Test has_plans when empty."""
         assert plan_manager.has_plans() is False
@@ -144,6 +168,66 @@ class TestPlanManagerPersistence:
         assert new_manager.get_plan("plan1") is not None
         assert new_manager.get_plan("plan2") is not None
 
+    def test_load_all_reports_invalid_files(self, sample_plan, tmp_path):
+        """Test that invalid files are reported while valid plans still load."""
+        manager = PlanManager(storage_dir=tmp_path)
+        for plan_id in ("plan1", "plan2", "plan3"):
+            manager.add_plan(plan_id, sample_plan)
+        manager.save_all()
+        (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+
+        new_manager = PlanManager(storage_dir=tmp_path)
+        loaded_count, errors = new_manager.load_all()
+
+        assert loaded_count == 3
+        assert len(errors) == 1
+        assert "broken.json" in errors[0]
+        assert set(new_manager.list_plan_ids()) == {"plan1", "plan2", "plan3"}
+
+    def test_load_all_reverts_unmarked_in_memory_changes(self, sample_plan, tmp_path):
+        """Test that reloading replaces plans changed in memory without marking the manager modified."""
+        sample_plan.to_json(tmp_path / "plan1.json")
+
+        manager = PlanManager(storage_dir=tmp_path)
+        manager.load_all()
+        categorize_unpaid_installments(manager.list_plans(), date(2024, 3, 1), upcoming_days=30, update_overdue=True)
+        assert manager.get_plan("plan1").installments[0].status == PaymentStatus.OVERDUE
+        assert not manager.has_unsaved_changes()
+
+        loaded_count, errors = manager.load_all()
+
+        assert loaded_count == 1
+        assert len(errors) == 0
+        assert manager.get_plan("plan1").installments[0].status == PaymentStatus.PENDING
+
+    def test_load_all_rereads_modified_files(self, sample_plan, tmp_path):
+        """Test that reloading picks up files modified since the last load."""
+        file_path = tmp_path / "plan1.json"
+        sample_plan.to_json(file_path)
+
+        manager = PlanManager(storage_dir=tmp_path)
+        manager.load_all()
+
+        sample_plan.set_merchant_name("Updated Store")
+        sample_plan.to_json(file_path)
+
+        manager.load_all()
+
+        assert manager.get_plan("plan1").merchant_name == "Updated Store"
+
+    def test_load_all_rereads_when_unsaved_changes(self, sample_plan, tmp_path):
+        """Test that reloading with unsaved changes replaces in-memory plans from disk."""
+        sample_plan.to_json(tmp_path / "plan1.json")
+
+        manager = PlanManager(storage_dir=tmp_path)
+        manager.load_all()
+        manager.get_plan("plan1").set_merchant_name("Unsaved Store")
+        manager.mark_as_modified()
+
+        manager.load_all()
+
+        assert manager.get_plan("plan1").merchant_name == "Test Store"
+
     def test_storage_dir_created(self, sample_plan, tmp_path):
         """Test that storage directory is created on save."""
         temp_path = tmp_path / "new_dir"
@@ -157,6 +241,21 @@ class TestPlanManagerPersistence:
         assert temp_path.exists()
         assert temp_path.is_dir()
 
+    def test_storage_dir_recreated_after_external_delete(self, sample_plan, tmp_path):
+        """Test that a storage directory deleted between saves is recreated by the next save."""
+        temp_path = tmp_path / "new_dir"
+        manager = PlanManager(storage_dir=temp_path)
+        manager.add_plan("test", sample_plan)
+        manager.save_all()
+
+        (temp_path / "test.json").unlink()
+        temp_path.rmdir()
+        saved_count, errors = manager.save_all()
+
+        assert saved_count == 1
+        assert len(errors) == 0
+        assert (temp_path / "test.json").exists()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -170,6 +170,25 @@ class TestInstallmentPlanSerialization:
         assert restored_plan.next_payment_due == sample_plan.next_payment_due
         assert restored_plan.num_installments == sample_plan.num_installments
 
+    @pytest.mark.filterwarnings("error")
+    @pytest.mark.parametrize(
+        "total_amount, expected_amount",
+        [(100, "50.0"), (90.0, "45.0")],
+        ids=["int", "float"],
+    )
+    def test_build_from_non_decimal_total_roundtrips_json(self, total_amount, expected_amount):
+        """Test that build coerces int and float totals to Decimal so they serialize as Decimal strings."""
+        plan = InstallmentPlan.build("Store", total_amount, date(2024, 1, 1), 2, 14, date(2024, 1, 15))
+
+        assert all(isinstance(inst.amount, Decimal) for inst in plan.installments)
+
+        parsed = json.loads(plan.to_json())
+        assert [inst["amount"] for inst in parsed["installments"]] == [expected_amount, expected_amount]
+
+        restored_plan = InstallmentPlan.from_json(plan.to_json())
+        assert restored_plan.total_amount == Decimal(total_amount)
+        assert restored_plan.installments[0].amount == Decimal(expected_amount)
+
 
 @pytest.mark.unit
 class TestInstallmentPlanValidation:
@@ -356,6 +375,11 @@ class TestInstallmentPlanComputedProperties:
         """Test has_overdue_payments property."""
         assert computed_properties_plan.has_overdue_payments is True
 
+    def test_has_overdue_as_of(self, computed_properties_plan):
+        """Test has_overdue_as_of ignores paid installments and is exclusive of the due date."""
+        assert computed_properties_plan.has_overdue_as_of(date(2024, 2, 15)) is False
+        assert computed_properties_plan.has_overdue_as_of(date(2024, 2, 16)) is True
+
     def test_update_overdue_status(self):
         """Test update_overdue_status method."""
         # Create plan with pending installments in the past